@@ -6,9 +6,11 @@ Integrates all data cleaning, normalization, and quality repair functionality
 
 # Standard library imports
 import re
-from typing import Any, Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 # Third-party library imports
+import numpy as np
 import pandas as pd
 
 # =============================================================================
@@ -24,6 +26,9 @@ MONTH_ABBR_TO_NUM = {
 # Missing value indicators (general)
 MISSING_VALUE_INDICATORS = ['-', '', 'nan', 'NaN', 'none', 'None', 'NULL', 'null', 'N/A', 'n/a']
 
+# Pre-normalized (stripped, lowercased) indicator set for O(1) membership checks
+_MISSING_VALUE_SET = frozenset(s.strip().lower() for s in MISSING_VALUE_INDICATORS)
+
 # =============================================================================
 # General Helper Functions
 # =============================================================================
@@ -39,13 +44,41 @@ def is_missing_value(value: Any) -> bool:
     if pd.isna(value) or value is None:
         return True
     
-    str_val = str(value).strip()
-    return str_val in MISSING_VALUE_INDICATORS or str_val.lower() in [x.lower() for x in MISSING_VALUE_INDICATORS]
+    return str(value).strip().lower() in _MISSING_VALUE_SET
 
 # =============================================================================
 # Database Column Name Normalization Functions (originally db_column_normalizer.py)
 # =============================================================================
 
+# Default PostgreSQL reserved words
+DEFAULT_RESERVED_WORDS = frozenset({
+    'user', 'order', 'group', 'select', 'from', 'where', 'insert', 'update', 
+    'delete', 'create', 'drop', 'alter', 'table', 'index', 'view', 'database',
+    'schema', 'primary', 'foreign', 'key', 'constraint', 'references', 'check',
+    'unique', 'not', 'null', 'default', 'auto_increment', 'serial', 'boolean',
+    'integer', 'varchar', 'text', 'date', 'time', 'timestamp', 'numeric',
+    'real', 'double', 'precision', 'decimal', 'char', 'binary', 'blob'
+})
+
+# Common unit and abbreviation normalization, applied in one pass by a single
+# alternation (no replacement can create another token, so order doesn't matter)
+_UNIT_REPLACEMENTS = {
+    '(mw)': '_mw',
+    '(gj)': '_gj',
+    '(mwh)': '_mwh',
+    '(tco2e)': '_tco2e',
+    '(s)': 's',
+    '(%)': '_percent',
+    '$': 'dollar_',
+}
+_UNIT_PATTERN = re.compile('|'.join(map(re.escape, _UNIT_REPLACEMENTS)))
+_NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+# Runs of whitespace and/or underscores collapse to a single underscore
+_SEPARATOR_PATTERN = re.compile(r'[\s_]+')
+
+def _replace_unit(match) -> str:
+    return _UNIT_REPLACEMENTS[match.group()]
+
 def normalize_db_column_name(name: str, reserved_words: Set[str] = None) -> str:
     """
     Normalize database column names
@@ -55,20 +88,21 @@ def normalize_db_column_name(name: str, reserved_words: Set[str] = None) -> str:
     Returns:
         Normalized column name
     """
+    if reserved_words is None:
+        # Same headers are normalized many times across tables and batches
+        return _normalize_db_column_name_default(name)
+    return _normalize_db_column_name(name, reserved_words)
+
+@lru_cache(maxsize=8192, typed=True)
+def _normalize_db_column_name_default(name) -> str:
+    """normalize_db_column_name with the default reserved words (memoized)"""
+    return _normalize_db_column_name(name, DEFAULT_RESERVED_WORDS)
+
+def _normalize_db_column_name(name, reserved_words) -> str:
+    """Normalize a column name against the given reserved words"""
     if not name or str(name).strip() == '':
         return 'unnamed_column'
     
-    # Default PostgreSQL reserved words
-    if reserved_words is None:
-        reserved_words = {
-            'user', 'order', 'group', 'select', 'from', 'where', 'insert', 'update', 
-            'delete', 'create', 'drop', 'alter', 'table', 'index', 'view', 'database',
-            'schema', 'primary', 'foreign', 'key', 'constraint', 'references', 'check',
-            'unique', 'not', 'null', 'default', 'auto_increment', 'serial', 'boolean',
-            'integer', 'varchar', 'text', 'date', 'time', 'timestamp', 'numeric',
-            'real', 'double', 'precision', 'decimal', 'char', 'binary', 'blob'
-        }
-    
     # Step 1: Basic cleaning
     clean_name = str(name).strip()
     
@@ -76,28 +110,13 @@ def normalize_db_column_name(name: str, reserved_words: Set[str] = None) -> str:
     clean_name = clean_name.lower()
     
     # Step 3: Handle special characters and abbreviations
-    # Common unit and abbreviation normalization
-    unit_replacements = {
-        r'\(mw\)': '_mw',
-        r'\(gj\)': '_gj', 
-        r'\(mwh\)': '_mwh',
-        r'\(tco2e\)': '_tco2e',
-        r'\(s\)': 's',
-        r'\(%\)': '_percent',
-        r'\$': 'dollar_',
-    }
-    
-    for pattern, replacement in unit_replacements.items():
-        clean_name = re.sub(pattern, replacement, clean_name)
+    clean_name = _UNIT_PATTERN.sub(_replace_unit, clean_name)
     
     # Step 4: Remove other special characters, keep alphanumeric and spaces
-    clean_name = re.sub(r'[^\w\s]', '', clean_name)
-    
-    # Step 5: Convert spaces to underscores
-    clean_name = re.sub(r'\s+', '_', clean_name)
+    clean_name = _NON_WORD_PATTERN.sub('', clean_name)
     
-    # Step 6: Merge multiple underscores into one
-    clean_name = re.sub(r'_+', '_', clean_name)
+    # Steps 5-6: Convert spaces to underscores and merge multiple underscores into one
+    clean_name = _SEPARATOR_PATTERN.sub('_', clean_name)
     
     # Step 7: Remove leading and trailing underscores
     clean_name = clean_name.strip('_')
@@ -120,6 +139,27 @@ def normalize_db_column_name(name: str, reserved_words: Set[str] = None) -> str:
     
     return clean_name
 
+def make_unique_name(name: str, used_names: Set[str], next_suffix: Dict[str, int]) -> str:
+    """
+    Return name, or name_1/name_2/... (first free suffix) if taken, and mark it used
+    Args:
+        name: Candidate name
+        used_names: Names already handed out (updated in place)
+        next_suffix: Next suffix to try per base name (updated in place). Suffixes below it
+            are already taken (used_names only grows), so each duplicate resumes where the
+            previous one stopped instead of rescanning from _1
+    Returns:
+        Unique name
+    """
+    if name in used_names:
+        counter = next_suffix.get(name, 1)
+        while f"{name}_{counter}" in used_names:
+            counter += 1
+        next_suffix[name] = counter + 1
+        name = f"{name}_{counter}"
+    used_names.add(name)
+    return name
+
 def normalize_column_mapping(columns: List[str]) -> List[str]:
     """
     Return normalized column name list of equal length in input order (ensuring uniqueness)
@@ -128,24 +168,11 @@ def normalize_column_mapping(columns: List[str]) -> List[str]:
     Returns:
         Normalized column name list of equal length (position aligned), adds _1/_2 suffix for duplicates
     """
-    normalized_list = []
     used_names = set()
-    
-    for original_col in columns:
-        normalized = normalize_db_column_name(original_col)
-        
-        # Handle duplicate normalized names (based on occurrence order)
-        if normalized in used_names:
-            counter = 1
-            base_name = normalized
-            while f"{base_name}_{counter}" in used_names:
-                counter += 1
-            normalized = f"{base_name}_{counter}"
-        
-        used_names.add(normalized)
-        normalized_list.append(normalized)
-    
-    return normalized_list
+    next_suffix = {}
+    # Handle duplicate normalized names (based on occurrence order)
+    return [make_unique_name(normalize_db_column_name(original_col), used_names, next_suffix)
+            for original_col in columns]
 
 def create_table_sql_with_normalized_columns(table_name: str, 
                                            column_definitions: Dict[str, str],
@@ -167,6 +194,7 @@ def create_table_sql_with_normalized_columns(table_name: str,
     # Build column definitions (ensure column name uniqueness)
     column_parts = []
     used_norm_cols = set()
+    next_suffix = {}
     
     # Primary key
     pk_norm = normalize_db_column_name(primary_key)
@@ -176,14 +204,7 @@ def create_table_sql_with_normalized_columns(table_name: str,
     
     # Other columns
     for col_name, col_type in column_definitions.items():
-        norm = normalize_db_column_name(col_name)
-        base = norm
-        if norm in used_norm_cols:
-            counter = 1
-            while f"{base}_{counter}" in used_norm_cols:
-                counter += 1
-            norm = f"{base}_{counter}"
-        used_norm_cols.add(norm)
+        norm = make_unique_name(normalize_db_column_name(col_name), used_norm_cols, next_suffix)
         column_parts.append(f"{norm} {col_type}")
     
     # Additional constraints
@@ -456,6 +477,40 @@ def clean_numeric_value(value: Any, target_type: str = 'float') -> Optional[floa
     except (ValueError, TypeError):
         return None
 
+# Characters stripped before parsing, per clean_numeric_value target type (compiled once)
+_NUMERIC_STRIP_PATTERNS = {
+    'percentage': [re.compile(r'[%\s,]')],
+    'currency': [re.compile(r'[$€£¥,\s]|AUD|USD|EUR|GBP', re.IGNORECASE)],
+    'capacity': [re.compile(r'[,\s]'), re.compile(r'[a-zA-Z]+')],
+}
+_DEFAULT_NUMERIC_STRIP = [re.compile(r'[,\s]')]
+
+def clean_numeric_series(series: pd.Series, target_type: str = 'float') -> pd.Series:
+    """
+    Column-wise clean_numeric_value
+    Args:
+        series: Original column
+        target_type: Target type ('integer', 'float', 'percentage', 'currency', 'capacity')
+    Returns:
+        float64 Series with NaN for missing or unparseable values
+    """
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        # Already numeric (typical for ABS sheets): no string parsing needed
+        values = series.astype('float64')
+    else:
+        text = series.astype(str).str.strip()
+        missing = series.isna() | text.str.lower().isin(_MISSING_VALUE_SET)
+        # Remove thousand separators, spaces and type-specific symbols or units
+        for pattern in _NUMERIC_STRIP_PATTERNS.get(target_type, _DEFAULT_NUMERIC_STRIP):
+            text = text.str.replace(pattern, '', regex=True)
+        values = pd.to_numeric(text.where(~missing), errors='coerce').astype('float64')
+    
+    if target_type == 'integer':
+        values = np.trunc(values)
+    elif target_type == 'percentage':
+        values = values / 100.0
+    return values
+
 def process_data_with_numeric_cleaning(df: pd.DataFrame, data_type: str = 'abs') -> Tuple[pd.DataFrame, Dict[str, str]]:
     """
     General data processing function including numeric conversion
@@ -485,9 +540,7 @@ def process_data_with_numeric_cleaning(df: pd.DataFrame, data_type: str = 'abs')
     for col, col_type in column_types.items():
         if col_type != 'text' and col in df_processed.columns:
             numeric_col = f"{col}_numeric"
-            df_processed[numeric_col] = df_processed[col].apply(
-                lambda x: clean_numeric_value(x, col_type)
-            )
+            df_processed[numeric_col] = clean_numeric_series(df_processed[col], col_type)
             
             success_count = df_processed[numeric_col].notna().sum()
             if success_count > 0:
@@ -786,7 +839,7 @@ def convert_cer_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
     for col in capacity_columns:
         # Convert numeric values (using general function)
         original_values = df_processed[col].copy()
-        df_processed[col] = df_processed[col].apply(lambda x: clean_numeric_value(x, 'capacity'))
+        df_processed[col] = clean_numeric_series(df_processed[col], 'capacity')
         
         # Count successful conversions
         success_count = df_processed[col].notna().sum()
@@ -844,7 +897,9 @@ def fix_missing_values(df: pd.DataFrame, missing_indicators: List[str] = None) -
         Repaired DataFrame
     """
     if missing_indicators is None:
-        missing_indicators = MISSING_VALUE_INDICATORS
+        indicator_set = _MISSING_VALUE_SET
+    else:
+        indicator_set = frozenset(str(s).strip().lower() for s in missing_indicators)
     
     df_fixed = df.copy()
     
@@ -853,13 +908,12 @@ def fix_missing_values(df: pd.DataFrame, missing_indicators: List[str] = None) -
     
     for col in df_fixed.columns:
         if df_fixed[col].dtype == 'object':  # Only process text columns
-            for indicator in missing_indicators:
-                # Exact match missing value indicators
-                mask = df_fixed[col].astype(str).str.strip() == indicator
-                count = mask.sum()
-                if count > 0:
-                    df_fixed.loc[mask, col] = None
-                    fix_count += count
+            # Case-insensitive match against all missing value indicators in a single pass
+            mask = df_fixed[col].astype(str).str.strip().str.lower().isin(indicator_set)
+            count = mask.sum()
+            if count > 0:
+                df_fixed.loc[mask, col] = None
+                fix_count += count
     
     print(f"  ✓ Missing value repair: {fix_count} missing value indicators repaired")
     return df_fixed
@@ -931,12 +985,11 @@ def fix_date_formats(df: pd.DataFrame) -> pd.DataFrame:
     date_columns = [col for col in df_fixed.columns if 'date' in col.lower()]
     
     total_fixed = 0
+    column_summaries = []
     
     for date_col in date_columns:
         if date_col not in df_fixed.columns:
             continue
-            
-        print(f"    Processing date column: {date_col}")
         
         # Create standardized date columns
         year_col = f"{date_col}_year_fixed"
@@ -976,7 +1029,11 @@ def fix_date_formats(df: pd.DataFrame) -> pd.DataFrame:
         df_fixed[iso_col] = iso_dates
         
         total_fixed += success_count
-        print(f"      ✓ Successfully parsed {success_count}/{len(df_fixed)} dates")
+        column_summaries.append(f"{date_col} ({success_count}/{len(df_fixed)})")
+    
+    # Emit one status line per table instead of one per column
+    if column_summaries:
+        print(f"    ✓ Parsed date columns: {', '.join(column_summaries)}")
     
     if total_fixed > 0:
         print(f"  ✓ Date format repair completed: {total_fixed} date values repaired")
@@ -985,6 +1042,22 @@ def fix_date_formats(df: pd.DataFrame) -> pd.DataFrame:
     
     return df_fixed
 
+def _apply_non_null(series: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """
+    Apply an element-wise function to the non-null cells only
+    Args:
+        series: Column to transform
+        func: Element-wise function that maps missing values to None
+    Returns:
+        Transformed column (None where the input was null)
+    """
+    # One vectorized null mask instead of a pd.isna dispatch inside func for every cell
+    mask = series.notna().to_numpy(dtype=bool)
+    result = np.full(len(series), None, dtype=object)
+    if mask.any():
+        result[mask] = [func(value) for value in series.to_numpy(dtype=object)[mask]]
+    return pd.Series(result, index=series.index)
+
 def fix_specific_data_issues(df: pd.DataFrame, data_type: str, **kwargs) -> pd.DataFrame:
     """
     Fix specific issues for particular data types
@@ -1001,9 +1074,12 @@ def fix_specific_data_issues(df: pd.DataFrame, data_type: str, **kwargs) -> pd.D
     # 1. Unified missing value handling
     df_fixed = fix_missing_values(df_fixed)
     
+    # Column set built once for the membership checks below (the fixes only rewrite existing columns)
+    present = set(df_fixed.columns)
+    
     if data_type.lower() == 'nger':
         # Standardize boolean fields
-        if 'gridconnected' in df_fixed.columns:
+        if 'gridconnected' in present:
             def standardize_grid_connected(value):
                 if pd.isna(value) or value is None:
                     return None
@@ -1015,17 +1091,17 @@ def fix_specific_data_issues(df: pd.DataFrame, data_type: str, **kwargs) -> pd.D
                 return None
             
             original_count = df_fixed['gridconnected'].notna().sum()
-            df_fixed['gridconnected'] = df_fixed['gridconnected'].apply(standardize_grid_connected)
+            df_fixed['gridconnected'] = _apply_non_null(df_fixed['gridconnected'], standardize_grid_connected)
             fixed_count = df_fixed['gridconnected'].notna().sum()
             print(f"    - gridconnected field standardization: {original_count} → {fixed_count}")
         
         # Standardize fuel types and facility names
-        if 'primaryfuel' in df_fixed.columns:
-            df_fixed['primaryfuel'] = df_fixed['primaryfuel'].apply(standardize_fuel_type)
+        if 'primaryfuel' in present:
+            df_fixed['primaryfuel'] = _apply_non_null(df_fixed['primaryfuel'], standardize_fuel_type)
             print(f"    - primaryfuel field standardization completed")
         
-        if 'facilityname' in df_fixed.columns:
-            df_fixed['facilityname'] = df_fixed['facilityname'].apply(lambda x: clean_facility_name(x, 'facility'))
+        if 'facilityname' in present:
+            df_fixed['facilityname'] = _apply_non_null(df_fixed['facilityname'], lambda x: clean_facility_name(x, 'facility'))
             print(f"    - facilityname field cleaning completed")
     
     elif data_type.lower() == 'cer':
@@ -1035,18 +1111,18 @@ def fix_specific_data_issues(df: pd.DataFrame, data_type: str, **kwargs) -> pd.D
         
         # Clean power station/project names
         name_columns = [col for col in ['power_station_name', 'Power station name', 'project_name', 'Project Name'] 
-                       if col in df_fixed.columns]
+                       if col in present]
         
         for name_col in name_columns:
-            df_fixed[name_col] = df_fixed[name_col].apply(lambda x: clean_facility_name(x, 'station'))
+            df_fixed[name_col] = _apply_non_null(df_fixed[name_col], lambda x: clean_facility_name(x, 'station'))
             print(f"    - {name_col} field cleaning completed")
         
         # Standardize fuel types
         fuel_columns = [col for col in ['fuel_source', 'Fuel Source', 'Fuel Source (s)'] 
-                       if col in df_fixed.columns]
+                       if col in present]
         
         for fuel_col in fuel_columns:
-            df_fixed[fuel_col] = df_fixed[fuel_col].apply(standardize_fuel_type)
+            df_fixed[fuel_col] = _apply_non_null(df_fixed[fuel_col], standardize_fuel_type)
             print(f"    - {fuel_col} field standardization completed")
     
     return df_fixed
@@ -2,11 +2,14 @@
 """Data acquisition and processing tools"""
 
 # Standard library imports
-import queue
+import atexit
 import re
+import signal
+import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
 # Third-party library imports
@@ -22,28 +25,37 @@ from selenium.webdriver.support.ui import WebDriverWait
 # Local module imports
 from data_cleaner import *
 from database_utils import *
-from excel_utils import get_merged_cells, read_merged_headers
+from excel_utils import read_sheet_with_merges
 from geocoding import (
     add_geocoding_to_cer_data,
     add_geocoding_to_nger_data,
+    flush_global_cache,
     initialize_geocoding_cache,
-    save_global_cache
+    save_global_cache,
+    start_cache_autosave
 )
 from time_format_utils import process_abs_time_format, process_nger_time_format
 
 # Configuration
 DATA_DIR = Path(__file__).resolve().parents[1] / "data"
 DATA_DIR.mkdir(exist_ok=True)
+GEOCODING_CACHE_FILE = str(DATA_DIR / "geocoding_cache.json")
+ABS_DATA_URL = "https://www.abs.gov.au/methodologies/data-region-methodology/2011-24/14100DO0003_2011-24.xlsx"
+ABS_DATA_FILE = DATA_DIR / "14100DO0003_2011-24.xlsx"
 SESSION = requests.Session()
 SESSION.headers.update({"User-Agent": "COMP5339-Assignment1/1.0"})
 
+# Worker threads of the NGER and ABS stages (each holds at most one pooled connection)
+NGER_WORKERS = 10
+ABS_WORKERS = 10
+
 
 # ============================================================================
 # Data Acquisition
 # ============================================================================
 
-def download_nger_year(year_data, results_queue):
-    """Download NGER data"""
+def download_nger_year(year_data):
+    """Download NGER data, returns (year_label, success, error)"""
     thread_id = threading.get_ident()
     year_label, url = year_data
     
@@ -81,17 +93,14 @@ def download_nger_year(year_data, results_queue):
             conn = get_db_connection()
             if conn and df is not None and not df.empty:
                 if save_nger_data(conn, year_label, df):
-                    results_queue.put((year_label, True, None))
                     print(f"[Thread {thread_id}] NGER data download and database insertion completed: {year_label}")
-                else:
-                    results_queue.put((year_label, False, "Database insertion failed"))
-            else:
-                results_queue.put((year_label, False, "Database connection failed"))
-        else:
-            results_queue.put((year_label, False, "Format error"))
+                    return (year_label, True, None)
+                return (year_label, False, "Database insertion failed")
+            return (year_label, False, "Database connection failed")
+        return (year_label, False, "Format error")
     except Exception as e:
-        results_queue.put((year_label, False, str(e)))
         print(f"[Thread {thread_id}] NGER data download failed: {year_label}: {e}")
+        return (year_label, False, str(e))
     finally:
         if 'conn' in locals() and conn:
             return_db_connection(conn)
@@ -107,22 +116,19 @@ def fetch_nger_data(max_workers=1):
         if not year_col or not url_col:
             return False
         
-        tasks = [(str(row[year_col]).strip(), str(row[url_col]).strip()) 
-                 for _, row in table.iterrows() 
-                 if str(row[url_col]).lower() != "nan"]
+        tasks = [(str(year).strip(), str(url).strip())
+                 for year, url in table[[year_col, url_col]].itertuples(index=False, name=None)
+                 if str(url).lower() != "nan"]
         
         print(f"Starting multi-threaded NGER data download ({max_workers} threads): {len(tasks)} year files")
         
-        results_queue = queue.Queue()
-        
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(download_nger_year, task, results_queue) for task in tasks]
-            [f.result() for f in as_completed(futures)]
+            futures = [executor.submit(download_nger_year, task) for task in tasks]
+            results = [f.result() for f in as_completed(futures)]
         
         # Process results
         success_count = 0
-        while not results_queue.empty():
-            item_label, success, error = results_queue.get()
+        for item_label, success, error in results:
             if error: 
                 print(f"{item_label}: {error}")
                 continue
@@ -136,13 +142,39 @@ def fetch_nger_data(max_workers=1):
         print(f"NGER data processing failed: {e}")
         return False
 
+def is_local_copy_current(url: str, filepath: Path, headers: dict = None) -> bool:
+    """Check a downloaded file against the remote Content-Length/Last-Modified (HEAD request only)"""
+    if not filepath.exists():
+        return False
+    try:
+        response = SESSION.head(url, allow_redirects=True, timeout=30, headers=headers)
+        response.raise_for_status()
+        
+        stat = filepath.stat()
+        content_length = response.headers.get('Content-Length')
+        if content_length is None or int(content_length) != stat.st_size:
+            return False
+        
+        last_modified = response.headers.get('Last-Modified')
+        if last_modified and stat.st_mtime < parsedate_to_datetime(last_modified).timestamp():
+            return False
+        return True
+    except Exception:
+        # Any doubt (network error, unparsable headers): download again
+        return False
+
 def fetch_abs_data():
-    """Download ABS data"""
-    url = "https://www.abs.gov.au/methodologies/data-region-methodology/2011-24/14100DO0003_2011-24.xlsx"
-    filepath = DATA_DIR / "14100DO0003_2011-24.xlsx"
+    """Download ABS data (skipped when the local copy is up to date)"""
+    url = ABS_DATA_URL
+    filepath = ABS_DATA_FILE
+    headers = {'User-Agent': 'Mozilla/5.0'}
+    
+    if is_local_copy_current(url, filepath, headers):
+        print("ABS data is up to date, using local copy")
+        return filepath
     
     try:
-        response = SESSION.get(url, stream=True, headers={'User-Agent': 'Mozilla/5.0'})
+        response = SESSION.get(url, stream=True, headers=headers)
         response.raise_for_status()
         with open(filepath, 'wb') as f:
             for chunk in response.iter_content(8192):
@@ -236,6 +268,7 @@ def get_max_pages(table_element):
 def scrape_paginated_table(driver, table_element, table_type):
     """Scrape paginated table"""
     max_pages, frames, page = get_max_pages(table_element), [], 1
+    page_counts = []
     print(f"{table_type}(max {max_pages} pages)")
     
     while page <= max_pages:
@@ -243,7 +276,7 @@ def scrape_paginated_table(driver, table_element, table_type):
             df = parse_table(table_element)
             if not df.empty: 
                 frames.append(df)
-                print(f"  Page {page}: {len(df)} rows")
+                page_counts.append(len(df))
             
             if page < max_pages:
                 try:
@@ -270,7 +303,8 @@ def scrape_paginated_table(driver, table_element, table_type):
     
     if frames:
         result = pd.concat(frames, ignore_index=True).drop_duplicates()
-        print(f"  {len(result)} rows")
+        # Single summary per table instead of one line per page
+        print(f"  {len(page_counts)} pages, {sum(page_counts)} rows scraped -> {len(result)} rows")
         return result
     return pd.DataFrame()
 
@@ -322,6 +356,8 @@ def fetch_cer_data(max_workers=1):
                 print(f"  Multi-threaded geocoding for CER data...")
                 df_geocoded = add_geocoding_to_cer_data(df_cleaned, table_type, max_workers)
                 
+                # Committed per table: the next table is scraped and geocoded over the network,
+                # which must not hold this transaction (and its ALTER TABLE locks) open
                 if save_cer_data(conn, table_type, df_geocoded):
                     success_count += 1
                     print(f"  CER table processing completed: {table_type}")
@@ -334,6 +370,10 @@ def fetch_cer_data(max_workers=1):
         
     except Exception as e:
         print(f"CER data processing failed: {e}")
+        try:
+            conn.rollback()
+        except Exception:
+            pass
         return False
     finally:
         if conn:
@@ -396,6 +436,19 @@ def run_threading_tasks(tasks, task_func, max_workers, operation_name):
     print(f"{operation_name} processing completed: {success_count}/{len(tasks)} tasks successful")
     return results
 
+def prepare_abs_sheet(file_path: str, sheet_name: str):
+    """Read and clean one ABS sheet"""
+    merged_cells, df = read_sheet_with_merges(file_path, sheet_name)
+    print(f"{sheet_name}: Found {len(merged_cells)} merged cells, {df.shape[0]} rows of data")
+    
+    # Process ABS time format (validation)
+    df = process_abs_time_format(df)
+    
+    # Data cleaning: value conversion and LGA standardization (before database insertion)
+    print(f"  Starting {sheet_name} data cleaning...")
+    df_cleaned, column_types = process_abs_data_with_cleaning(df)
+    return merged_cells, df_cleaned, column_types
+
 def process_abs_data(file_path: str, max_workers=4):
     """Multi-threaded ABS data processing"""
     try:
@@ -409,16 +462,7 @@ def process_abs_data(file_path: str, max_workers=4):
             level_info = levels[sheet_name]
             print(f"\nStarting ABS table processing: {sheet_name}({level_info['desc']})...")
             
-            merged_cells = get_merged_cells(file_path, sheet_name)
-            df = read_merged_headers(file_path, sheet_name)
-            print(f"Found {len(merged_cells)} merged cells, {df.shape[0]} rows of data")
-            
-            # Process ABS time format (validation)
-            df = process_abs_time_format(df)
-            
-            # Data cleaning: value conversion and LGA standardization (before database insertion)
-            print(f"  Starting {sheet_name} data cleaning...")
-            df_cleaned, column_types = process_abs_data_with_cleaning(df)
+            merged_cells, df_cleaned, column_types = prepare_abs_sheet(file_path, sheet_name)
             
             # Statistics on cleaning results
             numeric_cols = {k: v for k, v in column_types.items() if v != 'text'}
@@ -430,7 +474,6 @@ def process_abs_data(file_path: str, max_workers=4):
             print(f"Using {max_workers} threads for parallel ABS data processing...")
             
             results = run_threading_tasks(tasks, process_abs_merged_cell_with_db, max_workers, f"ABS table {sheet_name}")
-            
         
         print("ABS data processing completed")
         return True
@@ -446,33 +489,40 @@ def process_abs_data(file_path: str, max_workers=4):
 def create_table_direct(table_name: str, create_func, *args):
     """Create table directly"""
     conn = None
+    result = False
+    failed = False
     try:
         conn = get_db_connection()
         if not conn:
             print("Database connection failed")
             return False
         
-        if args:
-            return create_func(conn, *args)
-        else:
-            return create_func(conn)
+        result = create_func(conn, *args)
     except Exception as e:
         print(f"Failed to create {table_name}: {e}")
-        return False
+        result = False
+        failed = True
+        if conn:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            forget_known_tables()
     finally:
+        # Return the connection without overriding the create_func result;
+        # a connection that raised is discarded rather than handed to the next worker
         if conn:
-            return_db_connection(conn)
+            return_db_connection(conn, close=failed)
+    return result
 
 def print_final_results(results):
     """Print final results"""
-    success = sum(results)
-    print(f"\n{'='*50}")
-    print(f"Data processing system execution completed: {success}/3 modules successful")
-    nger_symbol = 'OK' if results[0] else 'FAIL'
-    abs_symbol = 'OK' if results[1] else 'FAIL'
-    cer_symbol = 'OK' if results[2] else 'FAIL'
-    print(f"NGER: {nger_symbol}  |  ABS: {abs_symbol}  |  CER: {cer_symbol}")
-    print(f"{'='*50}")
+    success = sum(bool(r) for r in results)
+    status = "  |  ".join(f"{name}: {'OK' if ok else 'FAIL'}" for name, ok in zip(['NGER', 'ABS', 'CER'], results))
+    print(f"\n{'='*50}\n"
+          f"Data processing system execution completed: {success}/{len(results)} modules successful\n"
+          f"{status}\n"
+          f"{'='*50}")
 
 def main():
     """Main function"""
@@ -481,18 +531,33 @@ def main():
     print("NGER Data + ABS Economic Data + CER Power Station Data")
     print("=" * 50)
     
-    # Initialize geocoding cache (preload cache to reduce API calls and disk I/O competition)
-    try:
-        initialize_geocoding_cache(str(DATA_DIR / "geocoding_cache.json"))
-    except Exception as e:
-        print(f"Warning: Geocoding cache initialization failed: {e}")
+    # Turn SIGTERM (e.g. container shutdown) into SystemExit so the finally block below runs;
+    # atexit covers any remaining exit path. Both cleanups are idempotent.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    atexit.register(close_connection_pool)
+    atexit.register(flush_global_cache)
+    
+    # Initialize geocoding cache in the background (preload cache to reduce API calls);
+    # table creation does not use it, so the JSON load overlaps with the DDL below
+    def _preload_geocoding_cache():
+        try:
+            initialize_geocoding_cache(GEOCODING_CACHE_FILE)
+        except Exception as e:
+            print(f"Warning: Geocoding cache initialization failed: {e}")
+    
+    cache_loader = threading.Thread(target=_preload_geocoding_cache, daemon=True)
+    cache_loader.start()
     
-    # Initialize connection pool
-    pool = get_connection_pool(minconn=2, maxconn=15)
+    # Initialize connection pool. The ceiling covers every connection that can be checked out
+    # at once: one per NGER and ABS worker, the CER stage's, the geometry index builders and
+    # this thread's; only a few are opened up front, the rest on demand
+    maxconn = NGER_WORKERS + ABS_WORKERS + 1 + INDEX_BUILD_WORKERS + 1
+    pool = get_connection_pool(minconn=2, maxconn=maxconn)
     if not pool:
         print("Database connection pool initialization failed")
         return
     
+    cache_autosave = None
     try:
         print("First create data tables, then acquire and process data...")
         
@@ -503,48 +568,65 @@ def main():
             print("Failed to prepare NGER tables")
             return
         
-        # NGER data acquisition and processing
-        print("\n" + "=" * 20 + " 2. NGER Data Acquisition and Processing " + "=" * 20)
-        nger_ok = fetch_nger_data(max_workers=10)
-        
         # Create CER tables
-        print("\n" + "=" * 20 + " 3. Create CER Tables " + "=" * 20)
+        print("\n" + "=" * 20 + " 2. Create CER Tables " + "=" * 20)
         cer_table_ok = create_table_direct("CER表", create_cer_tables)
         if not cer_table_ok:
             print("Failed to prepare CER tables")
             return
         
-        # CER power station data acquisition and processing
-        print("\n" + "=" * 20 + " 4. CER Power Station Data Acquisition and Processing " + "=" * 20)
-        cer_ok = fetch_cer_data()
-    
-        # ABS data processing
+        # Download ABS workbook and create ABS tables
         abs_file = fetch_abs_data()
         if abs_file:
-            print("\n" + "=" * 20 + " 5. Create ABS Tables " + "=" * 20)
-            conn = get_db_connection()
-            if not conn:
-                print("Database connection failed")
-                return
-            
-            try:
-                abs_table_ok = create_all_abs_tables(conn, str(abs_file))
-                if not abs_table_ok:
-                    print("ABS table preparation failed")
-                    return
-            except Exception as e:
-                print(f"ABS table creation failed: {e}")
-                return
-            finally:
-                return_db_connection(conn)
+            print("\n" + "=" * 20 + " 3. Create ABS Tables " + "=" * 20)
+            abs_table_ok = create_table_direct("ABS表", create_all_abs_tables, str(abs_file))
+            if not abs_table_ok:
+                print("ABS table preparation failed, skipping ABS data processing")
+                abs_file = None
+        
+        # Geocoding starts with the acquisition stages, so the cache must be loaded by now
+        cache_loader.join()
+        cache_autosave = start_cache_autosave(interval=60.0)
+        
+        # Bulk loads run without spatial indexes; they are rebuilt once in step 5
+        drop_geometry_indexes()
+        
+        # Schemas exist now: run the independent acquisition stages concurrently
+        print("\n" + "=" * 20 + " 4. NGER + CER + ABS Data Acquisition and Processing " + "=" * 20)
+        stage_results = {}
+        executor = ThreadPoolExecutor(max_workers=3)
+        try:
+            futures = {
+                executor.submit(fetch_nger_data, max_workers=NGER_WORKERS): 'NGER',
+                executor.submit(fetch_cer_data): 'CER',
+            }
+            if abs_file:
+                futures[executor.submit(process_abs_data, str(abs_file), max_workers=ABS_WORKERS)] = 'ABS'
             
-            print("\n" + "=" * 20 + " 6. ABS Economic Data Acquisition and Processing " + "=" * 20)
-            abs_ok = process_abs_data(str(abs_file), max_workers=10)
-        else:
-            abs_ok = False
+            for future in as_completed(futures):
+                stage = futures[future]
+                try:
+                    stage_results[stage] = future.result()
+                except Exception as e:
+                    print(f"{stage} data processing failed: {e}")
+                    stage_results[stage] = False
+        except (SystemExit, KeyboardInterrupt):
+            # SIGTERM/Ctrl-C: go straight to the cleanup below instead of waiting for the
+            # running stages (a `with` block would join them first)
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
+        
+        nger_ok = stage_results.get('NGER', False)
+        cer_ok = stage_results.get('CER', False)
+        abs_ok = stage_results.get('ABS', False)
+        
+        # Spatial indexes are built once, after all bulk loads
+        print("\n5. Creating geometry indexes...")
+        create_geometry_indexes()
         
         # Create proximity matches
-        print("\n7. Creating proximity matches (1km)...")
+        print("\n6. Creating proximity matches (1km)...")
         if create_proximity_join():
             print("Proximity matches created successfully")
         else:
@@ -553,7 +635,10 @@ def main():
         # Print final results
         print_final_results([nger_ok, abs_ok, cer_ok])
         
-        # Save geocoding cache
+    finally:
+        # Save geocoding cache (also on failure, so resolved addresses are not lost)
+        if cache_autosave:
+            cache_autosave.set()
         print("Saving geocoding cache...")
         try:
             save_global_cache()
@@ -561,7 +646,6 @@ def main():
         except Exception as e:
             print(f"Failed to save geocoding cache: {e}")
         
-    finally:
         # Close connection pool
         close_connection_pool()
 
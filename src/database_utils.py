@@ -2,19 +2,41 @@
 """Database configuration and operations"""
 
 # Standard library imports
+import csv
+import io
+import random
+import re
+import struct
 import threading
-from datetime import datetime
-from typing import List
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, List
 
 # Third-party library imports
+import numpy as np
 import pandas as pd
 import psycopg2
 import psycopg2.pool
-from psycopg2.extras import execute_values
+from psycopg2 import sql
+try:
+    from psycopg2.extras import execute_values
+except ImportError:  # psycopg2 < 2.7
+    execute_values = None
 
 # Local module imports
-from data_cleaner import *
-from excel_utils import get_merged_cells, read_merged_headers
+from data_cleaner import (
+    create_table_sql_with_normalized_columns,
+    detect_numeric_columns,
+    make_unique_name,
+    normalize_column_mapping,
+    normalize_db_column_name,
+    print_column_mapping_report,
+)
+from excel_utils import read_sheet_with_merges
 from state_standardizer import standardize_dataframe_states, standardize_state_name
 
 
@@ -27,14 +49,40 @@ DB_CONFIG = {
 _connection_pool = None
 _pool_lock = threading.Lock()
 
-# Connection tracking (for debugging)
+# Checkout slots (one per pooled connection): surplus threads wait here for a free
+# connection instead of failing with "connection pool exhausted"
+_pool_slots = None
+POOL_CHECKOUT_TIMEOUT = 60
+
+# Connections checked out of the pool (by id). Single set.add/set.remove calls are
+# atomic under the GIL, so no lock is needed
 _active_connections = set()
-_connections_lock = threading.Lock()
 
 # Schema migration flags (avoid repeating expensive ALTERs per process lifetime)
 _nger_schema_migrated = False
 # Note: CER schema migration is handled during table creation; no per-insert cache needed
 
+# Column names per table, read once from the catalog and kept in sync by our own ALTERs
+_table_columns = {}
+_table_columns_lock = threading.Lock()
+
+# Tables known to exist. Only positive catalog results and our own CREATE TABLEs are
+# recorded (set.add is atomic under the GIL); cleared when DDL is rolled back
+_known_tables = set()
+
+# Geometry columns per (table, column) -> whether GENERATED, and GiST indexes already
+# ensured; kept with the other schema caches so saves skip the catalog probes
+_geometry_columns = {}
+_known_indexes = set()
+
+# Binary COPY encoders per table and column list (None for a column type without one),
+# resolved from the catalog once instead of per pipelined batch
+_column_encoders = {}
+
+# Sessions on which the column_exists probe is already PREPAREd (prepared statements
+# live as long as the server session, i.e. the pooled connection)
+_column_probe_prepared = weakref.WeakSet()
+
 # Shared geocoding-related column definitions to avoid duplication
 GEOCODE_FIELDS = {
     'lat': 'NUMERIC',
@@ -48,37 +96,70 @@ GEOCODE_FIELDS = {
     'bbox_east': 'NUMERIC'
 }
 
+# Recognised spellings for boolean flags such as NGER grid_connected (read-only)
+BOOL_TOKENS = MappingProxyType({
+    **dict.fromkeys(['true', 'yes', '1', 'y', 't', 'connected', 'on-grid', 'on grid', 'ongrid', 'on'], True),
+    **dict.fromkeys(['false', 'no', '0', 'n', 'f', 'not connected', 'disconnected', 'off-grid', 'off grid', 'offgrid', 'off'], False),
+})
+
 def get_connection_pool(minconn=1, maxconn=10):
-    """Get database connection pool (singleton pattern)"""
-    global _connection_pool
-    
-    if _connection_pool is None:
-        with _pool_lock:
-            if _connection_pool is None:
-                try:
-                    _connection_pool = psycopg2.pool.ThreadedConnectionPool(
-                        minconn=minconn,
-                        maxconn=maxconn,
-                        **DB_CONFIG
-                    )
-                    print(f"PostgreSQL connection pool created successfully: {minconn}-{maxconn} connections")
-                    # Try to enable PostGIS extension (will be ignored if already enabled)
-                    try:
-                        _conn = _connection_pool.getconn()
-                        if _conn:
-                            with _conn.cursor() as _cur:
-                                _cur.execute("CREATE EXTENSION IF NOT EXISTS postgis;")
-                                _conn.commit()
-                                print("PostGIS extension enabled or already exists")
-                        if _conn:
-                            _connection_pool.putconn(_conn)
-                    except Exception as ee:
-                        print(f"Warning: Failed to enable PostGIS extension: {ee}")
-                except Exception as e:
-                    print(f"PostgreSQL connection pool creation failed: {e}")
-                    return None
-    
-    return _connection_pool
+    """Get database connection pool (created on first use)"""
+    pool = _connection_pool
+    if pool is not None:
+        return pool
+    with _pool_lock:
+        if _connection_pool is None:
+            _init_connection_pool(minconn, maxconn)
+        return _connection_pool
+
+def _init_connection_pool(minconn, maxconn):
+    """Create the global pool and checkout slots (caller holds _pool_lock)"""
+    global _connection_pool, _pool_slots
+    try:
+        pool = psycopg2.pool.ThreadedConnectionPool(
+            minconn=minconn,
+            maxconn=maxconn,
+            **DB_CONFIG
+        )
+    except Exception as e:
+        print(f"PostgreSQL connection pool creation failed: {e}")
+        return
+    print(f"PostgreSQL connection pool created successfully: {minconn}-{maxconn} connections")
+    _enable_postgis(pool)
+    _warm_pool(pool, minconn)
+    # Publish the pool last so lock-free readers never see it without its slots
+    _pool_slots = threading.BoundedSemaphore(maxconn)
+    _connection_pool = pool
+
+def _enable_postgis(pool):
+    """Try to enable PostGIS extension (will be ignored if already enabled)"""
+    try:
+        conn = pool.getconn()
+        if conn:
+            with conn.cursor() as cur:
+                cur.execute("CREATE EXTENSION IF NOT EXISTS postgis;")
+                conn.commit()
+                print("PostGIS extension enabled or already exists")
+            pool.putconn(conn)
+    except Exception as e:
+        print(f"Warning: Failed to enable PostGIS extension: {e}")
+
+def _warm_pool(pool, count):
+    """Validate the pre-opened connections once so checkouts can skip the SELECT 1 probe"""
+    warm = []
+    try:
+        for _ in range(count):
+            conn = pool.getconn()
+            if test_connection(conn):
+                conn.rollback()
+                warm.append(conn)
+            else:
+                pool.putconn(conn, close=True)
+    except Exception as e:
+        print(f"Warning: Failed to warm connection pool: {e}")
+    finally:
+        for conn in warm:
+            pool.putconn(conn)
 
 def test_connection(conn):
     """Test if connection is valid"""
@@ -91,73 +172,86 @@ def test_connection(conn):
 
 def track_connection(conn):
     """Track connection"""
-    with _connections_lock:
-        _active_connections.add(id(conn))
+    _active_connections.add(id(conn))
 
 def get_db_connection():
-    """Get database connection (from connection pool)"""
-    pool = get_connection_pool()
+    """Get database connection (from connection pool), waiting for a free slot if all are in use"""
+    pool = _connection_pool or get_connection_pool()
     if not pool:
         return None
     
-    try:
-        conn = pool.getconn()
-        if not conn:
-            return None
-            
-        # Test if connection is valid
-        if test_connection(conn):
-            track_connection(conn)
-            return conn
-        
-        # Connection invalid, try to get a new one
-        print("Connection test failed, trying to get a new one")
-        try:
-            pool.putconn(conn, close=True)
-        except:
-            pass
-            
-        conn = pool.getconn()
-        if conn and test_connection(conn):
-            track_connection(conn)
-            return conn
-            
-        return None
-    except Exception as e:
-        print(f"Failed to get connection from pool: {e}")
+    if not _pool_slots.acquire(timeout=POOL_CHECKOUT_TIMEOUT):
+        print(f"Timed out waiting for a free database connection ({POOL_CHECKOUT_TIMEOUT}s)")
         return None
+    
+    conn = _checkout_connection(pool)
+    if conn is None:
+        _pool_slots.release()
+    return conn
+
+# Checkout attempts before giving up (e.g. while the server is restarting)
+CHECKOUT_ATTEMPTS = 3
+
+def _checkout_connection(pool):
+    """Check out a live connection from the pool, retrying with jittered exponential backoff"""
+    for attempt in range(CHECKOUT_ATTEMPTS):
+        try:
+            conn = pool.getconn()
+            # Local state check only (no round-trip); a broken server connection
+            # surfaces as OperationalError to the caller
+            if conn and not conn.closed:
+                track_connection(conn)
+                return conn
+            if conn:
+                print("Pooled connection was closed, trying to get a new one")
+                # Already closed, so discarding it cannot block on the network
+                pool.putconn(conn, close=True)
+        except Exception as e:
+            print(f"Failed to get connection from pool (attempt {attempt + 1}/{CHECKOUT_ATTEMPTS}): {e}")
+        if attempt < CHECKOUT_ATTEMPTS - 1:
+            time.sleep(0.05 * 2 ** attempt + random.uniform(0, 0.01))
+    return None
 
-def return_db_connection(conn):
-    """Return database connection to connection pool"""
+def return_db_connection(conn, close: bool = False):
+    """Return database connection to connection pool (close=True discards it instead of reusing it)"""
     if not conn:
         return
     
     # Check if connection is tracked (prevent returning connections not from pool)
-    conn_id = id(conn)
-    with _connections_lock:
-        if conn_id not in _active_connections:
-            print("Attempting to return untracked connection, closing directly")
-            safe_close_connection(conn)
-            return
-        _active_connections.discard(conn_id)
-    
-    if not _connection_pool:
-        print("Connection pool does not exist, cannot return connection")
+    try:
+        _active_connections.remove(id(conn))
+    except KeyError:
+        print("Attempting to return untracked connection, closing directly")
         safe_close_connection(conn)
         return
     
     try:
-        # Check if connection is still valid
-        if not test_connection(conn):
-            print("Connection has expired, closing directly")
+        if not _connection_pool:
+            print("Connection pool does not exist, cannot return connection")
             safe_close_connection(conn)
             return
         
+        # Discard poisoned connections through the pool so its slot is freed
+        if close:
+            print("Discarding connection after failure")
+            _connection_pool.putconn(conn, close=True)
+            return
+        
+        # Local state only (no SELECT 1 round-trip): libpq marks the connection closed or
+        # its transaction status unknown once the server side is gone
+        if conn.closed or conn.info.transaction_status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+            print("Connection has expired, closing directly")
+            _connection_pool.putconn(conn, close=True)
+            return
+        
         # Return connection to pool
         _connection_pool.putconn(conn)
     except Exception as e:
         print(f"Failed to return connection to pool: {e}")
         safe_close_connection(conn)
+    finally:
+        # Free the checkout slot only after the pool has taken the connection back
+        _pool_slots.release()
 
 def safe_close_connection(conn):
     """Safely close connection"""
@@ -174,54 +268,194 @@ def close_connection_pool():
         _connection_pool.closeall()
         _connection_pool = None
         
-        # Clear connection tracking
-        with _connections_lock:
-            _active_connections.clear()
+        # Clear connection tracking and schema caches
+        _active_connections.clear()
+        forget_known_tables()
         
         print("Database connection pool closed")
 
 
 def table_exists(cursor, table_name: str) -> bool:
-    """Check if table exists"""
+    """Check if table exists (pg_class lookup, cached once the table is seen)"""
+    if table_name in _known_tables:
+        return True
     cursor.execute("""
         SELECT EXISTS (
-            SELECT FROM information_schema.tables 
-            WHERE table_schema = 'public' 
-            AND table_name = %s
+            SELECT FROM pg_class
+            WHERE relname = %s
+            AND relnamespace = 'public'::regnamespace
+            AND relkind IN ('r', 'p', 'v', 'm', 'f')
         );
     """, (table_name,))
-    return cursor.fetchone()[0]
+    exists = cursor.fetchone()[0]
+    if exists:
+        _known_tables.add(table_name)
+    return exists
+
+def forget_known_tables() -> None:
+    """Drop cached table existence (after a rolled-back CREATE or a pool reset)"""
+    _known_tables.clear()
+    _geometry_columns.clear()
+    _known_indexes.clear()
+    _column_encoders.clear()
+    with _table_columns_lock:
+        _table_columns.clear()
+
+def forget_table(table_name: str) -> None:
+    """Drop one table's cached schema (after a rolled-back write to it); the other tables'
+    entries stay, since concurrently running stages may be using them"""
+    _known_tables.discard(table_name)
+    for key in [key for key in list(_geometry_columns) if key[0] == table_name]:
+        _geometry_columns.pop(key, None)
+    for geom_col in GEOMETRY_COLUMNS:
+        _known_indexes.discard(_geometry_index_name(table_name, geom_col))
+    invalidate_table_columns(table_name)
+
+def get_existing_tables(cursor) -> set:
+    """Get names of all tables in the public schema (one catalog query)"""
+    cursor.execute("""
+        SELECT table_name FROM information_schema.tables
+        WHERE table_schema = 'public'
+    """)
+    tables = {row[0] for row in cursor.fetchall()}
+    _known_tables.update(tables)
+    return tables
 
 def column_exists(cursor, table_name: str, column_name: str) -> bool:
     """Check if column exists"""
-    cursor.execute("""
-        SELECT EXISTS (
-            SELECT FROM information_schema.columns 
-            WHERE table_schema = 'public' 
-            AND table_name = %s 
-            AND column_name = %s
-        );
-    """, (table_name, column_name))
+    # Parse/plan the information_schema query once per session, then EXECUTE it
+    if cursor.connection not in _column_probe_prepared:
+        cursor.execute("""
+            PREPARE column_exists_probe(text, text) AS
+            SELECT EXISTS (
+                SELECT FROM information_schema.columns 
+                WHERE table_schema = 'public' 
+                AND table_name = $1 
+                AND column_name = $2
+            );
+        """)
+        _column_probe_prepared.add(cursor.connection)
+    cursor.execute("EXECUTE column_exists_probe(%s, %s)", (table_name, column_name))
     return cursor.fetchone()[0]
 
 def add_column_if_not_exists(cursor, table_name: str, column_name: str, column_type: str) -> bool:
     """Add column if it doesn't exist"""
     try:
         if not column_exists(cursor, table_name, column_name):
-            cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}")
+            cursor.execute(sql.SQL("ALTER TABLE {} ADD COLUMN {} {}").format(
+                sql.Identifier(table_name), sql.Identifier(column_name), sql.SQL(column_type)))
             print(f"  Added column: {table_name}.{column_name} ({column_type})")
+            with _table_columns_lock:
+                if table_name in _table_columns:
+                    _table_columns[table_name].add(column_name)
             return True
         return False
     except Exception as e:
         print(f"  Warning: Failed to add column: {table_name}.{column_name} - {e}")
         return False
 
+def get_table_columns(cursor, table_name: str) -> set:
+    """Get the table's column names (cached after the first catalog query)"""
+    with _table_columns_lock:
+        if table_name in _table_columns:
+            return _table_columns[table_name]
+    cursor.execute("""
+        SELECT column_name FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = %s
+    """, (table_name,))
+    columns = {row[0] for row in cursor.fetchall()}
+    if columns:
+        # Don't cache a table that doesn't exist yet
+        with _table_columns_lock:
+            _table_columns[table_name] = columns
+    return columns
+
+def invalidate_table_columns(table_name: str) -> None:
+    """Forget cached columns (after DROP COLUMN or a rolled-back ALTER)"""
+    _column_encoders.pop(table_name, None)
+    with _table_columns_lock:
+        _table_columns.pop(table_name, None)
+
+def add_columns_if_not_exist(cursor, table_name: str, columns: dict) -> List[str]:
+    """Add any missing columns ({name: type}) with a single ALTER TABLE"""
+    existing = get_table_columns(cursor, table_name)
+    missing = [(name, col_type) for name, col_type in columns.items() if name not in existing]
+    if not missing:
+        return []
+    add_column = sql.SQL("ADD COLUMN IF NOT EXISTS {} {}")
+    clauses = [add_column.format(sql.Identifier(name), sql.SQL(col_type)) for name, col_type in missing]
+    alter_table = sql.SQL("ALTER TABLE {} {}")
+    if not execute_safe(cursor, alter_table.format(sql.Identifier(table_name), sql.SQL(', ').join(clauses))):
+        # Fall back to one ALTER per column so a single bad spec doesn't block the rest
+        failed = []
+        added = []
+        for (name, col_type), clause in zip(missing, clauses):
+            if execute_safe(cursor, alter_table.format(sql.Identifier(table_name), clause)):
+                added.append((name, col_type))
+            else:
+                failed.append(name)
+        if failed:
+            print(f"  Warning: Failed to add columns to {table_name}: {', '.join(failed)}")
+        missing = added
+    with _table_columns_lock:
+        existing.update(name for name, _ in missing)
+    for name, col_type in missing:
+        print(f"  Added column: {table_name}.{name} ({col_type})")
+    return [name for name, _ in missing]
+
+def alter_columns_type(cursor, table_name: str, columns: List[str], column_type: str) -> None:
+    """Change the type of those columns that exist with a single ALTER TABLE"""
+    existing = get_table_columns(cursor, table_name)
+    clauses = [sql.SQL("ALTER COLUMN {} TYPE {}").format(sql.Identifier(col), sql.SQL(column_type))
+               for col in columns if col in existing]
+    if not clauses:
+        return
+    _column_encoders.pop(table_name, None)
+    alter_table = sql.SQL("ALTER TABLE {} {}")
+    if not execute_safe(cursor, alter_table.format(sql.Identifier(table_name), sql.SQL(', ').join(clauses))):
+        # Fall back to one ALTER per column (e.g. stale cached column list)
+        for clause in clauses:
+            execute_safe(cursor, alter_table.format(sql.Identifier(table_name), clause))
+
+def drop_columns_if_exist(cursor, table_name: str, columns: List[str]) -> bool:
+    """Drop the given columns (where present) with a single ALTER TABLE"""
+    clauses = [sql.SQL("DROP COLUMN IF EXISTS {}").format(sql.Identifier(col)) for col in columns]
+    dropped = execute_safe(cursor, sql.SQL("ALTER TABLE {} {}").format(
+        sql.Identifier(table_name), sql.SQL(', ').join(clauses)))
+    invalidate_table_columns(table_name)
+    return dropped
+
+def execute_safe(cursor, statement, params=None) -> bool:
+    """Execute a statement whose failure is tolerated, without aborting the surrounding transaction"""
+    if cursor.connection.autocommit:
+        try:
+            cursor.execute(statement, params)
+            return True
+        except Exception:
+            return False
+    
+    cursor.execute("SAVEPOINT execute_safe")
+    try:
+        cursor.execute(statement, params)
+        cursor.execute("RELEASE SAVEPOINT execute_safe")
+        return True
+    except Exception:
+        cursor.execute("ROLLBACK TO SAVEPOINT execute_safe")
+        return False
+
+INVALID_VALUE_TOKENS = frozenset({'nan', 'none', 'null', '-'})
+
+# Lowercased stripped values that mean NULL, including the empty string (one lookup per cell)
+NULL_TOKENS = INVALID_VALUE_TOKENS | {''}
+
+# Placeholder strings left by astype(str) in otherwise empty CER columns
+_BLANK_CELL_TOKENS = frozenset({'', 'nan', 'None'})
+
 def is_valid_value(value) -> bool:
     """Check if value is valid (not null, not NaN, etc.)"""
     if value is None or pd.isna(value):
         return False
-    str_val = str(value).strip()
-    return str_val != '' and str_val.lower() not in {'nan', 'none', 'null', '-'}
+    return str(value).strip().lower() not in NULL_TOKENS
 
 def clean_value(value, max_length: int = None) -> str:
     """Clean value, return None or cleaned string"""
@@ -232,11 +466,110 @@ def clean_value(value, max_length: int = None) -> str:
         return str_val[:max_length]
     return str_val
 
+# Column-wise counterparts of is_valid_value / clean_value used to build insert rows
+# without iterating the DataFrame row by row
+def _stripped_and_valid(series: pd.Series):
+    """Return (stripped string column, validity mask) matching is_valid_value per cell"""
+    stripped = series.astype(str).str.strip()
+    valid = series.notna() & ~stripped.str.lower().isin(NULL_TOKENS)
+    return stripped, valid.to_numpy(dtype=bool)
+
+def none_values(length: int) -> np.ndarray:
+    """Object column of NULLs"""
+    return np.full(length, None, dtype=object)
+
+def nullable_values(series: pd.Series) -> np.ndarray:
+    """Column values as Python objects with NaN/NaT mapped to None"""
+    return np.where(series.notna().to_numpy(dtype=bool), series.to_numpy(dtype=object), None)
+
+def clean_values(series: pd.Series, max_length: int = None) -> np.ndarray:
+    """Vectorized clean_value: stripped (and truncated) strings, None where invalid"""
+    stripped, valid = _stripped_and_valid(series)
+    if max_length:
+        stripped = stripped.str.slice(0, max_length)
+    return np.where(valid, stripped.to_numpy(dtype=object), None)
+
+def numeric_values(series: pd.Series, strip_commas: bool = False) -> np.ndarray:
+    """Vectorized float conversion of valid values, None where invalid or unparseable"""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        # Already numeric (e.g. geocoded lat/lon): no string round-trip needed
+        numbers = series.astype('float64')
+        return np.where(numbers.notna().to_numpy(dtype=bool), numbers.to_numpy(dtype=object), None)
+    stripped, valid = _stripped_and_valid(series)
+    if strip_commas:
+        stripped = stripped.str.replace(',', '', regex=False)
+    numbers = pd.to_numeric(stripped.where(valid), errors='coerce')
+    return np.where(numbers.notna().to_numpy(dtype=bool), numbers.to_numpy(dtype=object), None)
+
+def bool_values(series: pd.Series) -> np.ndarray:
+    """Vectorized boolean parsing via BOOL_TOKENS, None where unrecognised"""
+    # Lowercase once for both the NULL-token check and the lookup
+    lowered = series.astype(str).str.strip().str.lower()
+    valid = series.notna().to_numpy(dtype=bool) & ~lowered.isin(NULL_TOKENS).to_numpy(dtype=bool)
+    parsed = lowered.map(BOOL_TOKENS)
+    return np.where(valid & parsed.notna().to_numpy(dtype=bool), parsed.to_numpy(dtype=object), None)
+
+def first_valid_values(df: pd.DataFrame, source_cols: List[str]) -> pd.Series:
+    """Per row, the value of the first source column holding a valid value (None otherwise)"""
+    chosen = none_values(len(df))
+    found = np.zeros(len(df), dtype=bool)
+    available = frozenset(df.columns)
+    for source_col in source_cols:
+        if found.all():
+            break
+        if source_col in available:
+            _, valid = _stripped_and_valid(df[source_col])
+            take = valid & ~found
+            chosen[take] = df[source_col].to_numpy(dtype=object)[take]
+            found |= take
+    return pd.Series(chosen, index=df.index, dtype=object)
+
+# Accepted date layouts for CER DATE columns, tried in order
+DATE_FORMATS = ["%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d %b %Y", "%b %Y", "%Y/%m/%d", "%Y.%m.%d"]
+
+def date_values(series: pd.Series) -> np.ndarray:
+    """Vectorized date parsing: each DATE_FORMATS entry over the still-unparsed values,
+    then a mixed-format dayfirst parse as a last resort; None where nothing matches"""
+    stripped, valid = _stripped_and_valid(series)
+    pending = valid.copy()
+    text = stripped.to_numpy(dtype=object)
+    result = none_values(len(series))
+    for fmt in DATE_FORMATS:
+        if not pending.any():
+            break
+        positions = np.flatnonzero(pending)
+        parsed = pd.to_datetime(pd.Series(text[positions], dtype=object), format=fmt, errors='coerce')
+        matched = parsed.notna().to_numpy(dtype=bool)
+        result[positions[matched]] = parsed[matched].dt.date.to_numpy(dtype=object)
+        pending[positions[matched]] = False
+    if pending.any():
+        # Remaining free-form values: one mixed-format pass infers each value's layout
+        positions = np.flatnonzero(pending)
+        parsed = pd.to_datetime(pd.Series(text[positions], dtype=object), format='mixed',
+                                dayfirst=True, errors='coerce')
+        matched = parsed.notna().to_numpy(dtype=bool)
+        result[positions[matched]] = parsed[matched].dt.date.to_numpy(dtype=object)
+    return result
+
+def geocode_values(df: pd.DataFrame, varchar_max_lengths: dict) -> List[np.ndarray]:
+    """Insert-ready columns for GEOCODE_FIELDS (NUMERIC as floats, VARCHAR truncated)"""
+    arrays = []
+    available = frozenset(df.columns)
+    for field, field_type in GEOCODE_FIELDS.items():
+        if field not in available:
+            arrays.append(none_values(len(df)))
+        elif field_type == 'NUMERIC':
+            arrays.append(numeric_values(df[field]))
+        else:
+            arrays.append(clean_values(df[field], max_length=varchar_max_lengths.get(field)))
+    return arrays
+
 def create_table_safe(cursor, table_name: str, create_sql: str) -> bool:
     """Safely create table"""
     try:
         if not table_exists(cursor, table_name):
             cursor.execute(create_sql)
+            _known_tables.add(table_name)
             print(f"Table created successfully: {table_name}")
             return True
         else:
@@ -292,9 +625,9 @@ def create_nger_table_impl(cursor):
     except Exception as e:
         print(f"Warning: NGER schema migration step failed: {e}")
     
-    # Ensure geometry column
+    # Ensure geometry columns (GiST indexes are built after the bulk load, see create_geometry_indexes)
     try:
-        ensure_geometry_column_and_index(cursor, 'nger_unified', 'lat', 'lon', 'geom')
+        ensure_all_geometries(cursor, 'nger_unified')
     except Exception as e:
         print(f"Warning: NGER geometry column processing failed: {e}")
     return True
@@ -316,12 +649,16 @@ def create_nger_table(conn) -> bool:
     except Exception as e:
         print(f"NGER table creation failed: {e}")
         conn.rollback()
+        forget_known_tables()
         return False
 
 def create_cer_tables_impl(cursor):
     """Create CER tables implementation (using normalized column names)"""
     
     cer_table_types = ['approved_power_stations', 'committed_power_stations', 'probable_power_stations']
+    # CREATE TABLE IF NOT EXISTS statements, sent together in one round-trip
+    ddl_batch = []
+    table_names = []
     
     for table_type in cer_table_types:
         # Basic column structure
@@ -389,11 +726,16 @@ def create_cer_tables_impl(cursor):
                     column_definitions.pop(k)
         
         normalized_table_name = normalize_db_column_name(f"cer_{table_type}")
-        create_sql = create_table_sql_with_normalized_columns(normalized_table_name, column_definitions)
-        
-        if not create_table_safe(cursor, normalized_table_name, create_sql):
-            return False
-        
+        ddl_batch.append(create_table_sql_with_normalized_columns(normalized_table_name, column_definitions))
+        table_names.append(normalized_table_name)
+    
+    try:
+        cursor.execute("\n".join(ddl_batch))
+    except Exception as e:
+        print(f"CER table creation failed: {e}")
+        return False
+    _known_tables.update(table_names)
+    for normalized_table_name in table_names:
         print(f"CER table creation completed (normalized column names): {normalized_table_name}")
 
     # After ensuring tables exist, migrate schema for approved/committed tables to enforce VARCHAR and drop unwanted columns
@@ -410,42 +752,26 @@ def create_cer_tables_impl(cursor):
     return True
 
 def create_cer_tables(conn) -> bool:
-    """Create CER tables (called in single thread)"""
+    """Create CER tables (called in single thread, one transaction for all CER DDL)"""
     try:
-        # Enforce short transaction for DDL so later rollbacks won't drop created tables
-        prev_autocommit = getattr(conn, 'autocommit', False)
+        cursor = conn.cursor()
         try:
-            # If we're currently inside a transaction, roll it back before toggling autocommit
-            try:
-                from psycopg2 import extensions as _pgext
-                if hasattr(conn, 'get_transaction_status'):
-                    status = conn.get_transaction_status()
-                    if status in (_pgext.TRANSACTION_STATUS_INTRANS, _pgext.TRANSACTION_STATUS_INERROR):
-                        conn.rollback()
-            except Exception:
-                # Best-effort rollback check
-                try:
-                    conn.rollback()
-                except Exception:
-                    pass
-
-            conn.autocommit = True
-            cursor = conn.cursor()
-            try:
-                result = create_cer_tables_impl(cursor)
-                return result
-            finally:
-                try:
-                    cursor.close()
-                except Exception:
-                    pass
+            result = create_cer_tables_impl(cursor)
+            if result is not False:
+                conn.commit()
+            else:
+                conn.rollback()
+                forget_known_tables()
+            return result
         finally:
             try:
-                conn.autocommit = prev_autocommit
+                cursor.close()
             except Exception:
                 pass
     except Exception as e:
         print(f"CER table creation failed: {e}")
+        conn.rollback()
+        forget_known_tables()
         return False
 
 
@@ -460,14 +786,19 @@ def create_all_abs_tables(conn, file_path: str) -> bool:
             "Table 2": {"desc": "Local Government Level", "level": 1}
         }
         
+        # Look up existing tables once and create the missing ones in one batch
+        existing_tables = get_existing_tables(cursor)
+        ddl_batch = []
+        
         for sheet_name in ["Table 1", "Table 2"]:
             level_info = levels[sheet_name]
             print(f"Pre-creating ABS tables: {sheet_name}({level_info['desc']})...")
             
             try:
-                merged_cells = get_merged_cells(file_path, sheet_name)
-                df = read_merged_headers(file_path, sheet_name)
+                merged_cells, df = read_sheet_with_merges(file_path, sheet_name)
                 print(f"Found {len(merged_cells)} merged cells requiring table creation")
+                # Detected types per column range (merged cells can share a range)
+                detected_types = {}
                 
                 for cell in merged_cells:
                     start_col, end_col = cell['start_col'] - 1, cell['end_col']
@@ -491,9 +822,12 @@ def create_all_abs_tables(conn, file_path: str) -> bool:
                         # Create table using normalized column names and type detection
                         
                         # Detect column types using only the merged-range columns
-                        subset_df = df.iloc[:, list(range(start_col_safe, end_col_safe))]
-                        subset_df.columns = selected_cols
-                        column_types = detect_numeric_columns(subset_df, start_col=0)
+                        col_range = (start_col_safe, end_col_safe)
+                        if col_range not in detected_types:
+                            subset_df = df.iloc[:, start_col_safe:end_col_safe]
+                            subset_df.columns = selected_cols
+                            detected_types[col_range] = detect_numeric_columns(subset_df, start_col=0)
+                        column_types = detected_types[col_range]
                         
                         # Create normalized column name list (same length and order as selected_cols)
                         normalized_cols = normalize_column_mapping(selected_cols)
@@ -526,15 +860,17 @@ def create_all_abs_tables(conn, file_path: str) -> bool:
                             column_definitions
                         )
                         
-                        if not create_table_safe(cursor, normalized_table_name, create_sql):
-                            print(f"ABS table creation failed: {cell['value']}")
-                            return False
+                        if normalized_table_name in existing_tables:
+                            print(f"Table already exists: {normalized_table_name}")
                         else:
-                            # Report column name normalization and type detection results
-                            print_column_mapping_report(selected_cols, normalized_cols)
-                            numeric_cols = {k: v for k, v in column_types.items() if v != 'text'}
-                            if numeric_cols:
-                                print(f"  {cell['value']}: Detected {len(numeric_cols)} numeric columns")
+                            ddl_batch.append(create_sql)
+                            existing_tables.add(normalized_table_name)
+                        
+                        # Report column name normalization and type detection results
+                        print_column_mapping_report(selected_cols, normalized_cols)
+                        numeric_cols = {k: v for k, v in column_types.items() if v != 'text'}
+                        if numeric_cols:
+                            print(f"  {cell['value']}: Detected {len(numeric_cols)} numeric columns")
                     except Exception as e:
                         print(f"ABS table creation failed: {cell['value']} - {e}")
                         return False
@@ -545,6 +881,10 @@ def create_all_abs_tables(conn, file_path: str) -> bool:
                 print(f"ABS table pre-creation failed: {sheet_name} - {e}")
                 return False
         
+        if ddl_batch:
+            cursor.execute("\n".join(ddl_batch))
+            print(f"Created {len(ddl_batch)} ABS tables")
+        
         # Commit transaction after successful creation to ensure tables actually exist
         conn.commit()
         return True
@@ -552,6 +892,7 @@ def create_all_abs_tables(conn, file_path: str) -> bool:
     except Exception as e:
         print(f"ABS table pre-creation failed: {e}")
         conn.rollback()
+        forget_known_tables()
         return False
     finally:
         try:
@@ -563,32 +904,320 @@ def create_all_abs_tables(conn, file_path: str) -> bool:
 
 
 
-def batch_insert(cursor, insert_sql: str, data: List[tuple], batch_size: int = 10000) -> None:
-    """High-performance batch insert using execute_values."""
+@lru_cache(maxsize=256)
+def prepare_insert_sql(table_name: str, columns: tuple) -> str:
+    """INSERT ... VALUES prefix for a table and column list (built once per distinct insert shape)"""
+    return f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES "
+
+def batch_insert(cursor, table_name: str, columns: List[str], data: List[tuple], page_size: int = 1000) -> None:
+    """Batch insert using execute_values (one multi-row VALUES statement per page)"""
     if not data:
         return
-    for i in range(0, len(data), batch_size):
-        chunk = data[i:i + batch_size]
-        # Transform INSERT ... VALUES (... placeholders ...) into INSERT ... VALUES %s
-        try:
-            values_pos = insert_sql.upper().rindex("VALUES")
-            base_insert = insert_sql[:values_pos] + "VALUES %s"
-        except ValueError:
-            # Fallback: assume standard form and append VALUES %s
-            base_insert = insert_sql.split("(")[0].strip() + " VALUES %s"
-        execute_values(cursor, base_insert, chunk, page_size=min(1000, batch_size))
+    data = _insert_rows(data)
+    # Not a PREPAREd statement (unlike the repeated catalog probe in column_exists):
+    # planning a plain INSERT is negligible next to the page's round-trip,
+    # executemany(EXECUTE ...) would go back to one round-trip per row, and loads
+    # above COPY_THRESHOLD use COPY, which is not planned at all
+    if execute_values is None:
+        batch_insert_mogrify(cursor, table_name, columns, data, page_size)
+        return
+    execute_values(cursor, prepare_insert_sql(table_name, tuple(columns)) + "%s", data, page_size=page_size)
+
+def _insert_float(value):
+    """Send floats the way COPY writes them (_copy_format_value): integral floats as integers
+    and NaN as NULL, so e.g. a TEXT column stores '2020' whichever path loads the row"""
+    if value != value:
+        return None
+    if value.is_integer():
+        return int(value)
+    return value
+
+def _insert_rows(data: List[tuple]) -> List[tuple]:
+    """Rows with their float values formatted as by _insert_float"""
+    return [tuple(_insert_float(v) if isinstance(v, float) else v for v in row) for row in data]
+
+def batch_insert_mogrify(cursor, table_name: str, columns: List[str], data: List[tuple], page_size: int = 1000) -> None:
+    """Multi-row INSERT built with cursor.mogrify (for psycopg2 without execute_values)"""
+    template = '(' + ', '.join(['%s'] * len(columns)) + ')'
+    head = prepare_insert_sql(table_name, tuple(columns)).encode()
+    for i in range(0, len(data), page_size):
+        values = b','.join(cursor.mogrify(template, row) for row in data[i:i + page_size])
+        cursor.execute(head + values)
+
+# NULL marker for COPY ... FORMAT csv (distinguishes NULL from empty strings)
+COPY_NULL = r'\N'
+
+def _copy_format_value(value):
+    """Format a Python value as a COPY CSV field"""
+    if value is None:
+        return COPY_NULL
+    if isinstance(value, (bool, np.bool_)):
+        # PostgreSQL's canonical boolean text (e.g. grid_connected)
+        return 't' if value else 'f'
+    if isinstance(value, float):
+        if value != value:  # NaN
+            return COPY_NULL
+        if value.is_integer():
+            # Integral floats (e.g. 2020.0) must load into INTEGER columns
+            return str(int(value))
+    return str(value)
+
+class _CsvCopyStream:
+    """File-like COPY CSV source rendering rows as copy_expert reads them,
+    so the CSV text of a whole batch is never held in memory at once"""
+    
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buf = io.StringIO()
+        self._writer = csv.writer(self._buf)
+    
+    def read(self, size: int = -1) -> str:
+        buf, writerow, format_value = self._buf, self._writer.writerow, _copy_format_value
+        for row in self._rows:
+            writerow([format_value(v) for v in row])
+            if 0 < size <= buf.tell():
+                break
+        chunk = buf.getvalue()
+        buf.seek(0)
+        buf.truncate()
+        return chunk
+
+def copy_insert(cursor, table_name: str, columns: List[str], data: List[tuple]) -> None:
+    """Bulk load rows with COPY FROM STDIN (CSV), falling back to batch_insert if the server rejects the data"""
+    if not data:
+        return
+    buf = _CsvCopyStream(data)
+    
+    copy_sql = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+    cursor.execute("SAVEPOINT copy_insert")
+    try:
+        cursor.copy_expert(copy_sql, buf)
+        cursor.execute("RELEASE SAVEPOINT copy_insert")
+    except Exception as e:
+        # COPY parses values strictly (no assignment casts), INSERT is more forgiving
+        cursor.execute("ROLLBACK TO SAVEPOINT copy_insert")
+        print(f"  COPY into {table_name} failed, falling back to INSERT: {e}")
+        batch_insert(cursor, table_name, columns, data)
+
+# Binary COPY framing: signature, flags and header-extension length; -1 field count ends the data
+_PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+_PGCOPY_TRAILER = struct.pack('!h', -1)
+_PGCOPY_NULL = struct.pack('!i', -1)
+
+# Precompiled big-endian packers for the per-field hot path
+_INT16 = struct.Struct('!h')
+_INT32 = struct.Struct('!i')
+_INT64 = struct.Struct('!q')
+_FLOAT32 = struct.Struct('!f')
+_FLOAT64 = struct.Struct('!d')
+
+def _as_int(value) -> int:
+    """Integer value for a binary integer field (integral floats allowed)"""
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"non-integral value for integer column: {value}")
+    return int(value)
+
+def _encode_numeric(value) -> bytes:
+    """Encode a value in PostgreSQL's binary NUMERIC layout (base-10000 digit groups)"""
+    number = Decimal(str(value).strip())
+    if number.is_nan():
+        return struct.pack('!hhHH', 0, 0, 0xC000, 0)
+    if not number.is_finite():
+        raise ValueError(f"infinite value for NUMERIC column: {value}")
+    sign, digits, exponent = number.as_tuple()
+    digit_str = ''.join(map(str, digits))
+    if exponent >= 0:
+        int_part, frac_part = digit_str + '0' * exponent, ''
+    else:
+        int_part, frac_part = digit_str[:exponent], digit_str[exponent:].rjust(-exponent, '0')
+    # Align both sides of the decimal point to 4-digit groups
+    int_part = int_part.lstrip('0')
+    int_part = int_part.rjust(-(-len(int_part) // 4) * 4, '0')
+    frac_part = frac_part.ljust(-(-len(frac_part) // 4) * 4, '0')
+    padded = int_part + frac_part
+    groups = [int(padded[i:i + 4]) for i in range(0, len(padded), 4)]
+    weight = len(int_part) // 4 - 1
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight, sign = 0, 0
+    return struct.pack(f'!hhHH{len(groups)}H', len(groups), weight, 0x4000 if sign else 0,
+                       max(0, -exponent), *groups)
+
+def _encode_bool(value) -> bytes:
+    """Encode a boolean field (only real booleans: strings must be parsed by the caller)"""
+    if not isinstance(value, (bool, np.bool_)):
+        raise ValueError(f"non-boolean value for boolean column: {value!r}")
+    return b'\x01' if value else b'\x00'
+
+def _encode_text(value) -> bytes:
+    return _copy_format_value(value).encode('utf-8')
+
+# Binary field encoders by information_schema data_type
+_BINARY_ENCODERS = {
+    'smallint': lambda v: _INT16.pack(_as_int(v)),
+    'integer': lambda v: _INT32.pack(_as_int(v)),
+    'bigint': lambda v: _INT64.pack(_as_int(v)),
+    'real': lambda v: _FLOAT32.pack(float(v)),
+    'double precision': lambda v: _FLOAT64.pack(float(v)),
+    'numeric': _encode_numeric,
+    'boolean': _encode_bool,
+    'text': _encode_text,
+    'character varying': _encode_text,
+}
 
-def prepare_insert_sql(table_name: str, columns: List[str]) -> str:
-    """Prepare insert SQL statement"""
-    placeholders = ', '.join(['%s'] * len(columns))
-    return f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+def get_column_types(cursor, table_name: str) -> dict:
+    """Get {column name: information_schema data_type} for a table"""
+    cursor.execute("""
+        SELECT column_name, data_type FROM information_schema.columns
+        WHERE table_schema = 'public' AND table_name = %s
+    """, (table_name,))
+    return dict(cursor.fetchall())
+
+def get_column_encoders(cursor, table_name: str, columns: List[str]) -> list:
+    """Get the binary COPY encoder of each column (None if its type has none), cached per table"""
+    key = tuple(columns)
+    encoders = _column_encoders.get(table_name, {}).get(key)
+    if encoders is None:
+        column_types = get_column_types(cursor, table_name)
+        encoders = [_BINARY_ENCODERS.get(column_types.get(col)) for col in columns]
+        _column_encoders.setdefault(table_name, {})[key] = encoders
+    return encoders
+
+def _encode_binary_copy(data: List[tuple], encoders: list) -> io.BytesIO:
+    """Build a COPY ... FORMAT binary stream for the rows"""
+    buf = io.BytesIO()
+    # Bind loop invariants to locals: this runs once per field
+    write = buf.write
+    pack_length = _INT32.pack
+    null_field = _PGCOPY_NULL
+    write(_PGCOPY_HEADER)
+    field_count = _INT16.pack(len(encoders))
+    for row in data:
+        write(field_count)
+        for value, encode in zip(row, encoders):
+            if value is None or (isinstance(value, float) and value != value):
+                write(null_field)
+            else:
+                field = encode(value)
+                write(pack_length(len(field)))
+                write(field)
+    write(_PGCOPY_TRAILER)
+    buf.seek(0)
+    return buf
+
+def copy_insert_binary(cursor, table_name: str, columns: List[str], data: List[tuple]) -> None:
+    """Bulk load rows with binary COPY (no server-side text parsing of numbers),
+    falling back to CSV COPY when a column type or value cannot be encoded"""
+    if not data:
+        return
+    encoders = get_column_encoders(cursor, table_name, columns)
+    if None in encoders:
+        print(f"  Binary COPY not applicable for {table_name} (unsupported column type), using CSV COPY")
+        copy_insert(cursor, table_name, columns, data)
+        return
+    try:
+        buf = _encode_binary_copy(data, encoders)
+    except (ValueError, TypeError, ArithmeticError, struct.error) as e:
+        print(f"  Binary COPY not applicable for {table_name} ({e!r}), using CSV COPY")
+        copy_insert(cursor, table_name, columns, data)
+        return
+    
+    cursor.execute("SAVEPOINT copy_insert_binary")
+    try:
+        cursor.copy_expert(f"COPY {table_name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT binary)", buf)
+        cursor.execute("RELEASE SAVEPOINT copy_insert_binary")
+    except Exception as e:
+        cursor.execute("ROLLBACK TO SAVEPOINT copy_insert_binary")
+        # The cached column types may be stale
+        _column_encoders.pop(table_name, None)
+        print(f"  Binary COPY into {table_name} failed, falling back to CSV COPY: {e}")
+        copy_insert(cursor, table_name, columns, data)
+
+# Row count above which COPY is used; smaller loads fit in a single execute_values page
+COPY_THRESHOLD = 1000
+
+def bulk_insert(cursor, table_name: str, columns: List[str], data: List[tuple], binary: bool = False) -> None:
+    """Insert rows with COPY for large loads (binary COPY if requested) and execute_values otherwise"""
+    if len(data) <= COPY_THRESHOLD:
+        # One page: a single multi-row INSERT statement
+        batch_insert(cursor, table_name, columns, data, page_size=COPY_THRESHOLD)
+    elif binary:
+        copy_insert_binary(cursor, table_name, columns, data)
+    else:
+        copy_insert(cursor, table_name, columns, data)
+
+
+# Pipelined batch sizing: the next batch is built while the previous one is sent, so
+# aim for a fixed memory footprint per batch rather than a fixed row count
+PIPELINE_BATCH_ROWS = 10000
+PIPELINE_BATCH_BYTES = 8 * 1024 * 1024
+PIPELINE_BATCH_MIN_ROWS = 2000
+PIPELINE_BATCH_MAX_ROWS = 50000
+PIPELINE_SAMPLE_ROWS = 200
+
+def pipeline_batch_rows(df: pd.DataFrame) -> int:
+    """Rows per pipelined batch for df, from the in-memory width of a sample of its rows"""
+    sample = df.head(PIPELINE_SAMPLE_ROWS)
+    if sample.empty:
+        return PIPELINE_BATCH_ROWS
+    row_bytes = max(int(sample.memory_usage(index=False, deep=True).sum()) // len(sample), 1)
+    return max(PIPELINE_BATCH_MIN_ROWS, min(PIPELINE_BATCH_MAX_ROWS, PIPELINE_BATCH_BYTES // row_bytes))
+
+def pipelined_insert(cursor, table_name: str, columns: List[str], df: pd.DataFrame,
+                     build_rows: Callable[[pd.DataFrame], List[tuple]], binary: bool = False) -> int:
+    """Insert df via bulk_insert in batches, overlapping row building for the next batch with
+    the send of the previous one (psycopg2 releases the GIL while waiting on the server).
+    The cursor is only ever used by one thread at a time. Returns the number of rows sent."""
+    batch_rows = pipeline_batch_rows(df)
+    if len(df) <= batch_rows:
+        data = build_rows(df)
+        bulk_insert(cursor, table_name, columns, data, binary=binary)
+        return len(data)
+    
+    row_count = 0
+    with ThreadPoolExecutor(max_workers=1) as sender:
+        in_flight = None
+        for start in range(0, len(df), batch_rows):
+            data = build_rows(df.iloc[start:start + batch_rows])
+            if in_flight is not None:
+                in_flight.result()
+            in_flight = sender.submit(bulk_insert, cursor, table_name, columns, data, binary)
+            row_count += len(data)
+        in_flight.result()
+    return row_count
+
+def _finish_write(conn, cursor, commit: bool, savepoint: str) -> None:
+    """Commit, or just release the call's savepoint when the caller owns the transaction"""
+    if commit:
+        conn.commit()
+    else:
+        cursor.execute(f"RELEASE SAVEPOINT {savepoint}")
 
+def _abort_write(conn, commit: bool, savepoint: str, table_name: str) -> None:
+    """Undo the call's work: the whole transaction, or only its savepoint when commit=False"""
+    if not commit:
+        try:
+            with conn.cursor() as cur:
+                cur.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                cur.execute(f"RELEASE SAVEPOINT {savepoint}")
+        except Exception:
+            conn.rollback()
+    else:
+        conn.rollback()
+    # The undone work may include DDL (added columns, geometry columns) on the written table
+    forget_table(table_name)
 
 # Specialized functions
-def save_nger_data(conn, year_label: str, df: pd.DataFrame) -> bool:
-    """Save NGER data"""
+def save_nger_data(conn, year_label: str, df: pd.DataFrame, commit: bool = True) -> bool:
+    """Save NGER data (commit=False leaves committing to the caller, e.g. once per pipeline)"""
     try:
         cursor = conn.cursor()
+        if not commit:
+            cursor.execute("SAVEPOINT save_nger_data")
         
         # Ensure schema types and dropped columns are applied (once per process)
         global _nger_schema_migrated
@@ -626,29 +1255,7 @@ def save_nger_data(conn, year_label: str, df: pd.DataFrame) -> bool:
         
         # Ensure geocoding columns exist (even if table already exists)
         geocode_fields = GEOCODE_FIELDS
-
-        for col_name, col_type in geocode_fields.items():
-            add_column_if_not_exists(cursor, 'nger_unified', col_name, col_type)
-
-        # Unified boolean parsing function (for grid_connected field)
-        def _parse_bool(value):
-            try:
-                if isinstance(value, bool):
-                    return value
-                s = str(value).strip().lower()
-                truthy = {
-                    'true', 'yes', '1', 'y', 't', 'connected', 'on-grid', 'on grid', 'ongrid', 'on'
-                }
-                falsy = {
-                    'false', 'no', '0', 'n', 'f', 'not connected', 'disconnected', 'off-grid', 'off grid', 'offgrid', 'off'
-                }
-                if s in truthy:
-                    return True
-                if s in falsy:
-                    return False
-                return None
-            except Exception:
-                return None
+        add_columns_if_not_exist(cursor, 'nger_unified', geocode_fields)
 
         # Max length constraints for VARCHAR fields
         varchar_max_lengths = {
@@ -664,81 +1271,70 @@ def save_nger_data(conn, year_label: str, df: pd.DataFrame) -> bool:
             'postcode': 16
         }
 
-        data = []
-        for _, row in df.iterrows():
-            row_data = [clean_value(year_label, max_length=varchar_max_lengths['year_label'])]
-            
+        # Resolve which source columns this DataFrame has once, not per batch
+        available = frozenset(df.columns)
+        basic_columns = ['facilityname', 'state', 'primaryfuel', 'reportingentity']
+        present_sources = {target_col: [col for col in source_cols if col in available]
+                           for target_col, source_cols in mappings.items()}
+
+        # Build insert columns one at a time, then zip them into row tuples
+        def build_rows(batch: pd.DataFrame) -> List[tuple]:
+            row_count = len(batch)
+            columns_data = [np.full(row_count, clean_value(year_label, max_length=varchar_max_lengths['year_label']), dtype=object)]
+        
             # Add time columns
-            start_year = row.get('start_year') if 'start_year' in df.columns else None
-            stop_year = row.get('stop_year') if 'stop_year' in df.columns else None
-            row_data.append(start_year)
-            row_data.append(stop_year)
-            
+            for col in ['start_year', 'stop_year']:
+                columns_data.append(nullable_values(batch[col]) if col in available else none_values(row_count))
+        
             # Basic columns (using normalized column names)
-            basic_columns = ['facilityname', 'state', 'primaryfuel', 'reportingentity']
             for col in basic_columns:
-                value = row.get(col) if col in df.columns else None
-                max_len = varchar_max_lengths.get(col)
-                row_data.append(clean_value(value, max_length=max_len))
-            
-            # Mapping columns
-            for target_col, source_cols in mappings.items():
-                value = None
-                for source_col in source_cols:
-                    if source_col in df.columns:
-                        val = row.get(source_col)
-                        if is_valid_value(val):
-                            if target_col == 'grid_connected':
-                                value = _parse_bool(val)
-                            elif target_col.endswith(('_gj', '_mwh', '_tco2e')):
-                                try:
-                                    value = float(str(val).replace(',', ''))
-                                except:
-                                    value = None
-                            else:
-                                # Truncate text-mapped VARCHAR targets
-                                max_len = varchar_max_lengths.get(target_col, None)
-                                value = clean_value(val, max_length=max_len)
-                            break
-                row_data.append(value)
-
-            # Append geocoding column values
-            for field in geocode_fields.keys():
-                value = row.get(field)
-                if field in ['lat', 'lon', 'bbox_south', 'bbox_north', 'bbox_west', 'bbox_east'] and is_valid_value(value):
-                    try:
-                        row_data.append(float(value))
-                    except:
-                        row_data.append(None)
+                if col in available:
+                    columns_data.append(clean_values(batch[col], max_length=varchar_max_lengths.get(col)))
                 else:
-                    row_data.append(clean_value(value, max_length=varchar_max_lengths.get(field)))
-            data.append(tuple(row_data))
+                    columns_data.append(none_values(row_count))
         
+            # Mapping columns (first source column with a valid value wins)
+            for target_col, source_cols in present_sources.items():
+                if not source_cols:
+                    columns_data.append(none_values(row_count))
+                    continue
+                # A single source needs no coalescing: the converters below already null invalid cells
+                values = batch[source_cols[0]] if len(source_cols) == 1 else first_valid_values(batch, source_cols)
+                if target_col == 'grid_connected':
+                    columns_data.append(bool_values(values))
+                elif target_col.endswith(('_gj', '_mwh', '_tco2e')):
+                    columns_data.append(numeric_values(values, strip_commas=True))
+                else:
+                    # Truncate text-mapped VARCHAR targets
+                    columns_data.append(clean_values(values, max_length=varchar_max_lengths.get(target_col)))
+
+            # Append geocoding column values
+            columns_data.extend(geocode_values(batch, varchar_max_lengths))
+            return list(zip(*columns_data))
+
         # Use normalized column names
         cols = ['year_label', 'start_year', 'stop_year', 'facility_name', 'state', 'primary_fuel', 'reporting_entity',
                 'facility_type', 'electricity_production_gj', 'electricity_production_mwh',
                 'emission_intensity_tco2e_mwh', 'scope1_emissions_tco2e', 'scope2_emissions_tco2e',
                 'total_emissions_tco2e', 'grid_info', 'grid_connected', 'important_notes'] + list(geocode_fields.keys())
         
-        # Batch insert
-        insert_sql = prepare_insert_sql('nger_unified', cols)
-        batch_insert(cursor, insert_sql, data)
+        # Bulk load (binary COPY for large batches: mostly NUMERIC columns, no server-side text parsing)
+        row_count = pipelined_insert(cursor, 'nger_unified', cols, df, build_rows, binary=True)
         
-        # Generate/update geom column after insertion
+        # Generate/update geom column after insertion (nothing new to fill if no rows were sent)
         try:
-            ensure_geometry_column_and_index(cursor, 'nger_unified', 'lat', 'lon', 'geom')
-            ensure_area_and_bbox_geometries(cursor, 'nger_unified',
-                                                'bbox_west', 'bbox_south', 'bbox_east', 'bbox_north')
+            if row_count:
+                ensure_all_geometries(cursor, 'nger_unified')
         except Exception as e:
             print(f"  Warning: NGER geometry column update failed: {e}")
 
-        conn.commit()
-        print(f"  NGER data insertion successful: {len(data)} rows -> nger_unified table")
+        _finish_write(conn, cursor, commit, "save_nger_data")
+        print(f"  NGER data insertion successful: {row_count} rows -> nger_unified table")
         return True
         
     except Exception as e:
         print(f"  NGER data insertion failed: {e}")
-        conn.rollback()
+        _abort_write(conn, commit, "save_nger_data", 'nger_unified')
         return False
     finally:
         try:
@@ -754,18 +1350,10 @@ def migrate_nger_unified_schema(cursor) -> None:
             'year_label', 'facility_name', 'state', 'facility_type', 'primary_fuel',
             'reporting_entity', 'grid_info', 'formatted_address', 'place_id', 'postcode'
         ]
-        for col in varchar_columns:
-            try:
-                cursor.execute(f"ALTER TABLE nger_unified ALTER COLUMN {col} TYPE VARCHAR")
-            except Exception as e:
-                # Ignore errors where column doesn't exist yet or already of desired type
-                pass
+        alter_columns_type(cursor, 'nger_unified', varchar_columns, 'VARCHAR')
         # Drop obsolete column if exists
-        try:
-            cursor.execute("ALTER TABLE nger_unified DROP COLUMN IF EXISTS controlling_corporation")
+        if drop_columns_if_exist(cursor, 'nger_unified', ['controlling_corporation']):
             print("  Dropped column: nger_unified.controlling_corporation (if existed)")
-        except Exception:
-            pass
     except Exception as e:
         # Surface minimal warning; do not fail caller
         print(f"  Warning: migrate_nger_unified_schema encountered an error: {e}")
@@ -777,12 +1365,8 @@ def migrate_cer_approved_schema(cursor) -> None:
         varchar_columns = [
             'accreditation_code', 'power_station_name', 'state', 'postcode', 'formatted_address', 'place_id'
         ]
-        for col in varchar_columns:
-            try:
-                cursor.execute(f"ALTER TABLE {table_name} ALTER COLUMN {col} TYPE VARCHAR")
-            except Exception:
-                # Ignore if column doesn't exist yet or type is already VARCHAR-compatible
-                pass
+        # Columns that don't exist yet are skipped
+        alter_columns_type(cursor, table_name, varchar_columns, 'VARCHAR')
         # These columns are being dropped for approved table; no type/cleanup needed
     except Exception as e:
         print(f"  Warning: migrate_cer_approved_schema encountered an error: {e}")
@@ -798,11 +1382,7 @@ def drop_unwanted_columns_for_cer_approved(cursor) -> None:
             # Per requirement: also drop these three columns
             'fuel_source', 'accreditation_start_date', 'approval_date'
         ]
-        for col in cols:
-            try:
-                cursor.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS {col}")
-            except Exception:
-                pass
+        drop_columns_if_exist(cursor, table, cols)
     except Exception as e:
         print(f"  Warning: drop_unwanted_columns_for_cer_approved encountered an error: {e}")
 
@@ -813,12 +1393,8 @@ def migrate_cer_committed_schema(cursor) -> None:
         varchar_columns = [
             'project_name', 'state', 'postcode', 'fuel_source', 'committed_date'
         ]
-        for col in varchar_columns:
-            try:
-                cursor.execute(f"ALTER TABLE {table_name} ALTER COLUMN {col} TYPE VARCHAR")
-            except Exception:
-                # Ignore if column doesn't exist yet or type is already VARCHAR-compatible
-                pass
+        # Columns that don't exist yet are skipped
+        alter_columns_type(cursor, table_name, varchar_columns, 'VARCHAR')
     except Exception as e:
         print(f"  Warning: migrate_cer_committed_schema encountered an error: {e}")
 
@@ -829,12 +1405,8 @@ def migrate_cer_probable_schema(cursor) -> None:
         varchar_columns = [
             'project_name', 'state', 'postcode', 'fuel_source', 'formatted_address', 'place_id'
         ]
-        for col in varchar_columns:
-            try:
-                cursor.execute(f"ALTER TABLE {table_name} ALTER COLUMN {col} TYPE VARCHAR")
-            except Exception:
-                # Ignore if column doesn't exist yet or type is already VARCHAR-compatible
-                pass
+        # Columns that don't exist yet are skipped
+        alter_columns_type(cursor, table_name, varchar_columns, 'VARCHAR')
     except Exception as e:
         print(f"  Warning: migrate_cer_probable_schema encountered an error: {e}")
 
@@ -848,11 +1420,7 @@ def drop_specified_columns_for_cer_committed(cursor) -> None:
             'accreditation_start_date_year', 'accreditation_start_date_month',
             'approval_date_year', 'approval_date_month'
         ]
-        for col in cols:
-            try:
-                cursor.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS {col}")
-            except Exception:
-                pass
+        drop_columns_if_exist(cursor, table, cols)
     except Exception as e:
         print(f"  Warning: drop_specified_columns_for_cer_committed encountered an error: {e}")
 
@@ -869,56 +1437,27 @@ def drop_specified_columns_for_cer_probable(cursor) -> None:
             'comitted_date_year', 'comitted_date_month',
             'approval_date_year', 'approval_date_month'
         ]
-        for col in cols:
-            try:
-                cursor.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS {col}")
-            except Exception:
-                pass
+        drop_columns_if_exist(cursor, table, cols)
     except Exception as e:
         print(f"  Warning: drop_specified_columns_for_cer_probable encountered an error: {e}")
 
-def save_cer_data(conn, table_type: str, df: pd.DataFrame) -> bool:
-    """Save CER data (using normalized column names, table already exists)"""
+def save_cer_data(conn, table_type: str, df: pd.DataFrame, commit: bool = True) -> bool:
+    """Save CER data (using normalized column names, table already exists).
+    commit=False leaves committing to the caller (the tables must already exist)."""
+    normalized_table_name = normalize_db_column_name(f"cer_{table_type}")
     try:
         cursor = conn.cursor()
-        normalized_table_name = normalize_db_column_name(f"cer_{table_type}")
-
-        # Ensure CER tables exist (idempotent). This prevents "relation does not exist" errors
-        # if insertion runs before the one-time table creation step.
-        try:
-            if not table_exists(cursor, normalized_table_name):
-                # Force short transaction for DDL to avoid being rolled back later
-                prev_autocommit = getattr(conn, 'autocommit', False)
-                try:
-                    # Ensure no active transaction before toggling autocommit
-                    try:
-                        from psycopg2 import extensions as _pgext
-                        if hasattr(conn, 'get_transaction_status'):
-                            status = conn.get_transaction_status()
-                            if status in (_pgext.TRANSACTION_STATUS_INTRANS, _pgext.TRANSACTION_STATUS_INERROR):
-                                conn.rollback()
-                    except Exception:
-                        try:
-                            conn.rollback()
-                        except Exception:
-                            pass
-
-                    conn.autocommit = True
-                    tmp_cur = conn.cursor()
-                    try:
-                        create_cer_tables_impl(tmp_cur)
-                    finally:
-                        try:
-                            tmp_cur.close()
-                        except Exception:
-                            pass
-                finally:
-                    try:
-                        conn.autocommit = prev_autocommit
-                    except Exception:
-                        pass
-        except Exception as ee:
-            print(f"  Warning: Ensuring CER tables failed: {ee}")
+        if not commit:
+            cursor.execute("SAVEPOINT save_cer_data")
+
+        # Ensure CER tables exist. create_cer_tables commits (or rolls back) the connection, so
+        # it only runs when this save owns the transaction; a caller batching saves with
+        # commit=False must create the tables first (main() does)
+        if not table_exists(cursor, normalized_table_name):
+            if not commit:
+                raise RuntimeError(f"table {normalized_table_name} does not exist; create CER tables first")
+            if not create_cer_tables(conn):
+                raise RuntimeError("CER table creation failed")
         
         # Standardize state names
         print(f"  Standardizing CER state names...")
@@ -933,17 +1472,19 @@ def save_cer_data(conn, table_type: str, df: pd.DataFrame) -> bool:
                 'approval_date': ['approval_date', 'Approval date', 'approval date']
             }
             df_alias_fixed = df.copy()
+            present = set(df_alias_fixed.columns)
             for canonical, candidates in alias_groups.items():
-                if canonical not in df_alias_fixed.columns:
+                if canonical not in present:
                     for cand in candidates:
-                        if cand in df_alias_fixed.columns:
+                        if cand in present:
                             df_alias_fixed[canonical] = df_alias_fixed[cand]
+                            present.add(canonical)
                             break
                 # If canonical exists but is entirely empty while candidates have data, backfill
-                if canonical in df_alias_fixed.columns:
-                    if df_alias_fixed[canonical].isna().all() or df_alias_fixed[canonical].astype(str).str.strip().isin(['', 'nan', 'None']).all():
+                if canonical in present:
+                    if df_alias_fixed[canonical].isna().all() or df_alias_fixed[canonical].astype(str).str.strip().isin(_BLANK_CELL_TOKENS).all():
                         for cand in candidates:
-                            if cand in df_alias_fixed.columns and not (df_alias_fixed[cand].astype(str).str.strip().isin(['', 'nan', 'None']).all()):
+                            if cand in present and not (df_alias_fixed[cand].astype(str).str.strip().isin(_BLANK_CELL_TOKENS).all()):
                                 df_alias_fixed[canonical] = df_alias_fixed[cand]
                                 break
             df = df_alias_fixed
@@ -987,6 +1528,7 @@ def save_cer_data(conn, table_type: str, df: pd.DataFrame) -> bool:
         
         # Prepare column information for data insertion
         used_names = {'id'}
+        next_suffix = {}
         clean_original_cols = []
         original_to_clean = {}
         for col in original_cols:
@@ -995,25 +1537,15 @@ def save_cer_data(conn, table_type: str, df: pd.DataFrame) -> bool:
             if clean_col in ['postcode', 'state_full', 'country', 'locality']:
                 clean_col = f"original_{clean_col}"
             # Ensure uniqueness
-            original_name = clean_col
-            counter = 1
-            while clean_col in used_names:
-                clean_col = f"{original_name}_{counter}"
-                counter += 1
-            used_names.add(clean_col)
+            clean_col = make_unique_name(clean_col, used_names, next_suffix)
             clean_original_cols.append(clean_col)
             original_to_clean[col] = clean_col
         
         # Dynamically add columns to table
         all_columns = clean_original_cols + list(geocode_fields.keys())
-        for col_name in all_columns:
-            # Determine column type
-            if col_name in geocode_fields:
-                col_type = geocode_fields[col_name]
-            else:
-                col_type = 'TEXT'  # Default to TEXT type
-            
-            add_column_if_not_exists(cursor, normalized_table_name, col_name, col_type)
+        # Original columns default to TEXT
+        add_columns_if_not_exist(cursor, normalized_table_name,
+                                 {**dict.fromkeys(clean_original_cols, 'TEXT'), **geocode_fields})
         
         # Max length constraints for VARCHAR fields relevant to CER
         varchar_max_lengths = {
@@ -1027,72 +1559,45 @@ def save_cer_data(conn, table_type: str, df: pd.DataFrame) -> bool:
             'place_id': 128
         }
 
-        # Convert CER date-like strings to datetime.date for DATE columns
-        def _to_date(value):
-            if not is_valid_value(value):
-                return None
-            s = str(value).strip()
-            for fmt in ["%Y-%m-%d", "%d/%m/%Y", "%d-%m-%Y", "%d %b %Y", "%b %Y", "%Y/%m/%d", "%Y.%m.%d"]:
-                try:
-                    dt = datetime.strptime(s, fmt)
-                    return dt.date()
-                except Exception:
-                    continue
-            # Try pandas to_datetime as a last resort
-            try:
-                dt = pd.to_datetime(s, errors='coerce', dayfirst=True)
-                if pd.notna(dt):
-                    return dt.date()
-            except Exception:
-                pass
-            return None
-
-        # Prepare data
-        data = []
-        
-        for _, row in df.iterrows():
-            row_data = []
-            for col in original_cols:
-                val = row.get(col)
-                target_col = original_to_clean.get(col)
-                max_len = varchar_max_lengths.get(target_col)
+        # Resolve each source column's position (duplicate headers: first occurrence) and
+        # conversion once, rather than per column per batch
+        first_position = {}
+        for position, col in enumerate(df.columns):
+            first_position.setdefault(col, position)
+        date_targets = set() if table_type == 'approved_power_stations' else {'accreditation_start_date', 'approval_date'}
+        column_plan = [(first_position[col], original_to_clean.get(col)) for col in original_cols]
+
+        # Prepare data column by column
+        def build_rows(batch: pd.DataFrame) -> List[tuple]:
+            columns_data = []
+            for position, target_col in column_plan:
+                series = batch.iloc[:, position]
                 # Convert specific known columns to DATE compatible values
-                if original_to_clean.get(col) in ['accreditation_start_date', 'approval_date'] and table_type != 'approved_power_stations':
-                    row_data.append(_to_date(val))
-                else:
-                    row_data.append(clean_value(val, max_length=max_len))
-            
-            for field in geocode_fields.keys():
-                value = row.get(field)
-                if field in ['lat', 'lon', 'bbox_south', 'bbox_north', 'bbox_west', 'bbox_east'] and is_valid_value(value):
-                    try:
-                        row_data.append(float(value))
-                    except:
-                        row_data.append(None)
+                if target_col in date_targets:
+                    columns_data.append(date_values(series))
                 else:
-                    row_data.append(clean_value(value, max_length=varchar_max_lengths.get(field)))
-            
-            data.append(tuple(row_data))
+                    columns_data.append(clean_values(series, max_length=varchar_max_lengths.get(target_col)))
         
+            columns_data.extend(geocode_values(batch, varchar_max_lengths))
+            return list(zip(*columns_data))
+
         # Insert
-        insert_sql = prepare_insert_sql(normalized_table_name, all_columns)
-        batch_insert(cursor, insert_sql, data)
+        row_count = pipelined_insert(cursor, normalized_table_name, all_columns, df, build_rows)
         
-        # Create/update geom column for CER table
+        # Create/update geom column for CER table (nothing new to fill if no rows were sent)
         try:
-            ensure_geometry_column_and_index(cursor, normalized_table_name, 'lat', 'lon', 'geom')
-            ensure_area_and_bbox_geometries(cursor, normalized_table_name,
-                                            'bbox_west', 'bbox_south', 'bbox_east', 'bbox_north')
+            if row_count:
+                ensure_all_geometries(cursor, normalized_table_name)
         except Exception as e:
             print(f"  Warning: CER geometry column update failed: {e}")
 
-        conn.commit()
-        print(f"  CER data insertion successful: {normalized_table_name} ({len(data)} rows, with geocoding)")
+        _finish_write(conn, cursor, commit, "save_cer_data")
+        print(f"  CER data insertion successful: {normalized_table_name} ({row_count} rows, with geocoding)")
         return True
         
     except Exception as e:
         print(f"  CER data insertion failed: {e}")
-        conn.rollback()
+        _abort_write(conn, commit, "save_cer_data", normalized_table_name)
         return False
     finally:
         try:
@@ -1114,7 +1619,30 @@ def create_abs_table_with_types(conn, merged_cell_value: str, columns: List[str]
 
  
 
-def insert_abs_data_cleaned(conn, table_name: str, df: pd.DataFrame, geo_level: int = None, column_types: dict = None) -> bool:
+# SQL type for ABS columns added at insert time, by detected column type (anything else is TEXT)
+ABS_SQL_TYPES = MappingProxyType({
+    'integer': 'INTEGER',
+    'float': 'NUMERIC',
+    'percentage': 'NUMERIC',
+    'currency': 'NUMERIC',
+})
+
+# Column-name keywords for the fallback type guess (one compiled alternation per type)
+_NUMERIC_NAME_PATTERN = re.compile('percent|rate|ratio')
+_INTEGER_NAME_PATTERN = re.compile('count|number|total|year')
+_ABS_KEY_COLUMNS = frozenset({'code', 'label'})
+
+def abs_code_values(series: pd.Series) -> np.ndarray:
+    """ABS Code column as Python ints (any decimal part truncated), None where not numeric"""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        codes = pd.Series(np.trunc(series.to_numpy(dtype='float64', na_value=np.nan)))
+    else:
+        codes = pd.to_numeric(series.astype(str).str.strip().str.split('.').str[0], errors='coerce')
+    valid = series.notna().to_numpy(dtype=bool) & codes.notna().to_numpy(dtype=bool)
+    return np.where(valid, codes.fillna(0).astype('int64').to_numpy(dtype=object), None)
+
+def insert_abs_data_cleaned(conn, table_name: str, df: pd.DataFrame, geo_level: int = None, column_types: dict = None,
+                            commit: bool = True) -> bool:
     """Insert cleaned ABS data using only merged-range columns (no fixed Code/Label/Year).
 
     Critical: Align insertion column normalization with table creation by using
@@ -1122,96 +1650,97 @@ def insert_abs_data_cleaned(conn, table_name: str, df: pd.DataFrame, geo_level:
     "number_of_business_exits_with_turnover_of_zero_to_less_than" consistently map
     to the same normalized names created earlier. This prevents accidental new
     columns and NULL inserts due to name mismatches.
+
+    commit=False leaves committing to the caller (a failure only undoes this call).
     """
     try:
         cursor = conn.cursor()
+        if not commit:
+            cursor.execute("SAVEPOINT insert_abs_data")
+        else:
+            # Bulk-load settings for this transaction only (revert at COMMIT/ROLLBACK). Losing the
+            # last commit in a server crash is acceptable: the ABS load is idempotent and re-runnable.
+            # Not set under a caller's transaction: SET LOCAL outlives RELEASE SAVEPOINT and would
+            # apply to the caller's remaining work and commit
+            cursor.execute("SET LOCAL synchronous_commit = off")
+            cursor.execute("SET LOCAL work_mem = '256MB'")
         
         print(f"  💾Inserting cleaned ABS data to: {table_name}")
         
         # Prepare column name mapping for all columns in df (must mirror table creation)
         # Use equal-length, order-preserving normalization to avoid mismatches.
         normalized_cols = normalize_column_mapping(list(df.columns))
-        original_to_clean = {orig: norm for orig, norm in zip(df.columns, normalized_cols)}
+        # Normalized names are unique, so each maps back to exactly one original column
+        clean_to_original = dict(zip(normalized_cols, df.columns))
         cols = normalized_cols
 
         # Before insertion, ensure all columns exist in target table (prevent missing column errors due to inconsistent column name mapping)
         try:
+            # One catalog query (cached per table) instead of one per column
+            existing_columns = get_table_columns(cursor, table_name)
+            missing_columns = {}
             for clean_col in cols:
-                if not column_exists(cursor, table_name, clean_col):
+                if clean_col not in existing_columns:
                     # Infer column type: prioritize passed column_types (based on original column name), otherwise guess based on column name
                     sql_type = 'TEXT'
-                    # Reverse lookup original column name for type hints
-                    source_col = next((orig for orig, mapped in original_to_clean.items() if mapped == clean_col), None)
+                    # Original column name for type hints
+                    source_col = clean_to_original.get(clean_col)
                     if column_types and source_col and source_col in column_types:
-                        ct = column_types[source_col]
-                        if ct in ['integer']:
-                            sql_type = 'INTEGER'
-                        elif ct in ['float', 'percentage', 'currency']:
-                            sql_type = 'NUMERIC'
-                        else:
-                            sql_type = 'TEXT'
+                        sql_type = ABS_SQL_TYPES.get(column_types[source_col], 'TEXT')
                     else:
                         # Heuristic inference based on column name
                         lc = clean_col.lower()
-                        if any(k in lc for k in ['percent', 'rate', 'ratio']):
+                        if _NUMERIC_NAME_PATTERN.search(lc):
                             sql_type = 'NUMERIC'
-                        elif any(k in lc for k in ['count', 'number', 'total', 'year']):
+                        elif _INTEGER_NAME_PATTERN.search(lc):
                             sql_type = 'INTEGER'
                         else:
                             sql_type = 'TEXT'
                     # Force specific ABS key columns to VARCHAR
-                    if clean_col.lower() in ['code', 'label']:
+                    if clean_col.lower() in _ABS_KEY_COLUMNS:
                         sql_type = 'VARCHAR'
-                    add_column_if_not_exists(cursor, table_name, clean_col, sql_type)
+                    missing_columns[clean_col] = sql_type
             # Ensure geographic_level exists if we were provided a geo_level
-            if geo_level is not None and not column_exists(cursor, table_name, 'geographic_level'):
-                add_column_if_not_exists(cursor, table_name, 'geographic_level', 'INTEGER')
+            if geo_level is not None and 'geographic_level' not in existing_columns:
+                missing_columns['geographic_level'] = 'INTEGER'
+            # All missing columns in a single ALTER TABLE
+            add_columns_if_not_exist(cursor, table_name, missing_columns)
         except Exception as ee:
             print(f"  Warning: ABS column validation/supplementation failed: {ee}")
         
         # Prepare insertion data (data already cleaned)
-        data = []
-        for _, row in df.iterrows():
-            row_data = []
-            
-            # Insert values for all columns directly (already cleaned)
-            for col in df.columns:
-                value = row[col]
-                if pd.isna(value):
-                    row_data.append(None)
-                else:
-                    # Coerce ABS Code to integer if possible
-                    if str(col).strip().lower() == 'code':
-                        try:
-                            code_val = int(str(value).strip().split('.')[0])
-                        except Exception:
-                            code_val = None
-                        row_data.append(code_val)
-                    else:
-                        row_data.append(value)
-            # Append geographic_level constant per row if provided
+        code_positions = [position for position, col in enumerate(df.columns) if str(col).strip().lower() == 'code']
+        n_cols = df.shape[1]
+
+        def build_rows(batch: pd.DataFrame) -> List[tuple]:
+            # One 2-D object conversion and null mask for the whole batch (ABS sheets are wide
+            # and mostly numeric), plus a trailing slot for the geographic_level constant
+            values = np.empty((len(batch), n_cols + (geo_level is not None)), dtype=object)
+            values[:, :n_cols] = batch.to_numpy(dtype=object)
+            values[:, :n_cols][batch.isna().to_numpy(dtype=bool)] = None
+            for position in code_positions:
+                values[:, position] = abs_code_values(batch.iloc[:, position])
             if geo_level is not None:
-                row_data.append(int(geo_level))
-            
-            data.append(tuple(row_data))
-        
+                values[:, n_cols] = int(geo_level)
+            return list(map(tuple, values))
+
         # If geo_level provided, include geographic_level in the insert column list
         insert_columns = list(cols)
         if geo_level is not None:
             insert_columns.append('geographic_level')
-        insert_sql = prepare_insert_sql(table_name, insert_columns)
-        batch_insert(cursor, insert_sql, data, 10000)
+        # ABS tables are mostly INTEGER/NUMERIC columns: binary COPY skips numeric text parsing
+        row_count = pipelined_insert(cursor, table_name, insert_columns, df, build_rows, binary=True)
         
-        conn.commit()
+        _finish_write(conn, cursor, commit, "insert_abs_data")
         
         # Simplified statistics report
-        print(f"  ABS data insertion successful: {len(data)} rows (pre-cleaned)")
+        print(f"  ABS data insertion successful: {row_count} rows (pre-cleaned)")
         
         return True
         
     except Exception as e:
         print(f"  ABS data insertion failed: {e}")
-        conn.rollback()
+        _abort_write(conn, commit, "insert_abs_data", table_name)
         return False
     finally:
         try:
@@ -1223,91 +1752,190 @@ def insert_abs_data_cleaned(conn, table_name: str, df: pd.DataFrame, geo_level:
 # PostGIS/Geometry helper functions
 # =============================================================================
 
-def geometry_column_exists(cursor, table_name: str, geom_col: str = 'geom') -> bool:
-    """Check if geometry column exists."""
+def geometry_columns_generated(cursor, table_name: str, geom_cols: List[str]) -> dict:
+    """Check which geometry columns are GENERATED in one catalog query
+    ({column: bool}; columns that don't exist are left out)."""
     cursor.execute(
         """
-        SELECT EXISTS (
-            SELECT 1 FROM information_schema.columns
-            WHERE table_schema = 'public'
-              AND table_name = %s
-              AND column_name = %s
-        );
+        SELECT column_name, is_generated FROM information_schema.columns
+        WHERE table_schema = 'public'
+          AND table_name = %s
+          AND column_name = ANY(%s);
         """,
-        (table_name, geom_col)
+        (table_name, list(geom_cols))
     )
-    return bool(cursor.fetchone()[0])
+    return {name: is_generated == 'ALWAYS' for name, is_generated in cursor.fetchall()}
+
+
+def _point_geometry_expr(lat_col: str, lon_col: str) -> str:
+    """SQL expression building a Point(4326) from lat/lon columns"""
+    return (f"ST_SetSRID(ST_MakePoint(NULLIF({lon_col}::text,'')::double precision, "
+            f"NULLIF({lat_col}::text,'')::double precision), 4326)")
+
+
+def _bbox_geometry_expr(bbox_w_col: str, bbox_s_col: str, bbox_e_col: str, bbox_n_col: str) -> str:
+    """SQL expression building a Polygon(4326) envelope from bbox columns (NULL if any side is NULL)"""
+    return (f"ST_MakeEnvelope({bbox_w_col}::double precision, {bbox_s_col}::double precision, "
+            f"{bbox_e_col}::double precision, {bbox_n_col}::double precision, 4326)")
+
+
+def _ensure_geometry_columns(cursor, table_name: str, specs: List[tuple]) -> dict:
+    """Add the missing geometry columns of specs [(column, geometry type, expr)] with a single
+    ALTER TABLE. Returns {column: True if GENERATED}, i.e. filled at INSERT time so no UPDATE
+    pass is needed."""
+    generated = {}
+    missing = []
+    unknown = [geom_col for geom_col, _, _ in specs if (table_name, geom_col) not in _geometry_columns]
+    # One catalog query for all columns not seen yet
+    found = geometry_columns_generated(cursor, table_name, unknown) if unknown else {}
+    for geom_col, geom_type, expr in specs:
+        key = (table_name, geom_col)
+        state = _geometry_columns[key] if key in _geometry_columns else found.get(geom_col)
+        if state is None:
+            missing.append((geom_col, geom_type, expr))
+        else:
+            _geometry_columns[key] = generated[geom_col] = state
+    if not missing:
+        return generated
 
+    def add_columns(clause: str) -> str:
+        return f"ALTER TABLE {table_name} " + ", ".join(
+            clause.format(col=geom_col, type=geom_type, expr=expr) for geom_col, geom_type, expr in missing) + ";"
 
-def ensure_geometry_column_and_index(cursor, table_name: str, lat_col: str = 'lat', lon_col: str = 'lon', geom_col: str = 'geom') -> None:
-    """Ensure geometry(Point,4326) column exists and is populated from lat/lon, create GiST index."""
-    # 1) Add geometry column
-    if not geometry_column_exists(cursor, table_name, geom_col):
-        try:
-            cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {geom_col} geometry(Point, 4326);")
-            print(f"  Added geometry column: {table_name}.{geom_col}")
-        except Exception as e:
-            # If failed due to extension not enabled, upper layer should have tried to enable it
-            raise e
-    # 2) Update geom with lat/lon (only null values)
-    update_sql = f"""
-        UPDATE {table_name}
-        SET {geom_col} = ST_SetSRID(ST_MakePoint(NULLIF({lon_col}::text,'')::double precision,
-                                                 NULLIF({lat_col}::text,'')::double precision), 4326)
-        WHERE {geom_col} IS NULL AND {lat_col} IS NOT NULL AND {lon_col} IS NOT NULL;
+    # Stored generated columns (PostgreSQL 12+); older servers get plain columns filled by UPDATE
+    is_generated = execute_safe(cursor, add_columns(
+        "ADD COLUMN {col} geometry({type}, 4326) GENERATED ALWAYS AS ({expr}) STORED"))
+    if not is_generated:
+        cursor.execute(add_columns("ADD COLUMN {col} geometry({type}, 4326)"))
+    for geom_col, _, _ in missing:
+        print(f"  Added {'generated ' if is_generated else ''}geometry column: {table_name}.{geom_col}")
+        _geometry_columns[(table_name, geom_col)] = generated[geom_col] = is_generated
+    return generated
+
+
+def ensure_gist_index(cursor, table_name: str, geom_col: str, concurrently: bool = False) -> None:
+    """Create GiST index on a geometry column if it does not exist.
+
+    concurrently=True doesn't block writers but must run outside a transaction (autocommit).
     """
-    cursor.execute(update_sql)
-    # 3) Create GiST index (if not exists)
-    index_name = f"{table_name}_{geom_col}_gist"
-    try:
-        cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} USING GIST ({geom_col});")
-    except Exception as e:
-        # Compatible with older Postgres versions without IF NOT EXISTS: ignore already exists error
-        try:
-            cursor.execute(f"SELECT 1 FROM pg_class WHERE relname = %s;", (index_name,))
-            exists = bool(cursor.fetchone())
-            if not exists:
-                cursor.execute(f"CREATE INDEX {index_name} ON {table_name} USING GIST ({geom_col});")
-        except Exception:
-            pass
+    index_name = _geometry_index_name(table_name, geom_col)
+    if index_name in _known_indexes:
+        return
+    create = "CREATE INDEX CONCURRENTLY" if concurrently else "CREATE INDEX"
+    # IF NOT EXISTS is available on every supported server (9.5+), no pg_class probe needed
+    cursor.execute(sql.SQL(create + " IF NOT EXISTS {} ON {} USING GIST ({})").format(
+        sql.Identifier(index_name), sql.Identifier(table_name), sql.Identifier(geom_col)))
+    _known_indexes.add(index_name)
     print(f"  Geometry index ensured: {index_name}")
 
-def ensure_area_and_bbox_geometries(cursor, table_name: str,
-                                    bbox_w_col: str = 'bbox_west', bbox_s_col: str = 'bbox_south',
-                                    bbox_e_col: str = 'bbox_east', bbox_n_col: str = 'bbox_north',
-                                    bbox_geom_col: str = 'geom_bbox') -> None:
-    """Ensure bbox polygon geometry column exists and is populated, create GiST index."""
-    # bbox polygon column
-    if not geometry_column_exists(cursor, table_name, bbox_geom_col):
-        cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {bbox_geom_col} geometry(Polygon, 4326);")
-        print(f"  Added geometry column: {table_name}.{bbox_geom_col}")
-
-    # Populate bbox polygon with bbox (only null values)
-    cursor.execute(f"""
-        UPDATE {table_name}
-        SET {bbox_geom_col} =
-            CASE
-                WHEN {bbox_w_col} IS NOT NULL AND {bbox_s_col} IS NOT NULL AND {bbox_e_col} IS NOT NULL AND {bbox_n_col} IS NOT NULL THEN
-                    ST_MakeEnvelope({bbox_w_col}::double precision, {bbox_s_col}::double precision,
-                                    {bbox_e_col}::double precision, {bbox_n_col}::double precision, 4326)
-                ELSE {bbox_geom_col}
-            END
-        WHERE {bbox_geom_col} IS NULL;
-    """)
 
-    # Index
-    index_name = f"{table_name}_{bbox_geom_col}_gist"
+def ensure_all_geometries(cursor, table_name: str, lat_col: str = 'lat', lon_col: str = 'lon',
+                          bbox_cols=('bbox_west', 'bbox_south', 'bbox_east', 'bbox_north'),
+                          geom_col: str = 'geom', bbox_geom_col: str = 'geom_bbox') -> None:
+    """Ensure point and bbox geometry columns exist and populate both in one pass.
+
+    GiST indexes are left to create_geometry_indexes, so bulk loads don't pay per-row index maintenance.
+    """
+    bbox_w_col, bbox_s_col, bbox_e_col, bbox_n_col = bbox_cols
+    point_expr = _point_geometry_expr(lat_col, lon_col)
+    bbox_expr = _bbox_geometry_expr(*bbox_cols)
+    point_pending = f"{geom_col} IS NULL AND {lat_col} IS NOT NULL AND {lon_col} IS NOT NULL"
+    bbox_pending = (f"{bbox_geom_col} IS NULL AND {bbox_w_col} IS NOT NULL AND {bbox_s_col} IS NOT NULL "
+                    f"AND {bbox_e_col} IS NOT NULL AND {bbox_n_col} IS NOT NULL")
+
+    # Generated columns are filled at INSERT time; only plain (older) columns need the UPDATE
+    assignments = []
+    conditions = []
+    generated = _ensure_geometry_columns(cursor, table_name, [(geom_col, 'Point', point_expr),
+                                                              (bbox_geom_col, 'Polygon', bbox_expr)])
+    if not generated[geom_col]:
+        assignments.append(f"{geom_col} = CASE WHEN {point_pending} THEN {point_expr} ELSE {geom_col} END")
+        conditions.append(f"({point_pending})")
+    if not generated[bbox_geom_col]:
+        assignments.append(f"{bbox_geom_col} = CASE WHEN {bbox_pending} THEN {bbox_expr} ELSE {bbox_geom_col} END")
+        conditions.append(f"({bbox_pending})")
+
+    # Single scan fills whichever geometry is still null (newly inserted rows)
+    if assignments:
+        cursor.execute(f"UPDATE {table_name} SET {', '.join(assignments)} WHERE {' OR '.join(conditions)};")
+
+
+# Tables whose geometry columns get GiST indexes once loading is done
+GEOMETRY_TABLES = ['nger_unified', 'cer_approved_power_stations',
+                   'cer_committed_power_stations', 'cer_probable_power_stations']
+GEOMETRY_COLUMNS = ['geom', 'geom_bbox']
+
+# Memory for the GiST builds (sort-based builds need far more than the default 64MB)
+INDEX_MAINTENANCE_WORK_MEM = '1GB'
+# Tables indexed at the same time, each on its own session: GiST builds don't use
+# max_parallel_maintenance_workers, so parallelism has to come from separate builds
+INDEX_BUILD_WORKERS = 2
+
+def _geometry_index_name(table_name: str, geom_col: str) -> str:
+    return f"{table_name}_{geom_col}_gist"
+
+def drop_geometry_indexes(tables: List[str] = None) -> bool:
+    """Drop the geometry GiST indexes before bulk loading (rebuilt by create_geometry_indexes),
+    so inserts into tables left indexed by an earlier run don't pay per-row index maintenance"""
+    conn = get_db_connection()
+    if not conn:
+        print("Database connection failed")
+        return False
+    
+    try:
+        cursor = conn.cursor()
+        for table_name in tables or GEOMETRY_TABLES:
+            for geom_col in GEOMETRY_COLUMNS:
+                index_name = _geometry_index_name(table_name, geom_col)
+                cursor.execute(sql.SQL("DROP INDEX IF EXISTS {}").format(sql.Identifier(index_name)))
+                _known_indexes.discard(index_name)
+        conn.commit()
+        return True
+    
+    except Exception as e:
+        print(f"✗ Failed to drop geometry indexes: {e}")
+        conn.rollback()
+        return False
+    finally:
+        return_db_connection(conn)
+
+def _create_table_geometry_indexes(table_name: str) -> bool:
+    """Build the GiST indexes of one table's geometry columns (CONCURRENTLY, no write lock)"""
+    conn = get_db_connection()
+    if not conn:
+        print("Database connection failed")
+        return False
+    
     try:
-        cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} USING GIST ({bbox_geom_col});")
+        # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+        conn.autocommit = True
+        cursor = conn.cursor()
+        cursor.execute(f"SET maintenance_work_mem = '{INDEX_MAINTENANCE_WORK_MEM}'")
+        try:
+            # Index only the geometry columns that exist
+            for geom_col in geometry_columns_generated(cursor, table_name, GEOMETRY_COLUMNS):
+                ensure_gist_index(cursor, table_name, geom_col, concurrently=True)
+        finally:
+            # Don't leave the setting on the pooled session
+            cursor.execute("RESET maintenance_work_mem")
+        return True
+    
     except Exception as e:
+        print(f"✗ Failed to create geometry indexes on {table_name}: {e}")
+        return False
+    finally:
         try:
-            cursor.execute(f"SELECT 1 FROM pg_class WHERE relname = %s;", (index_name,))
-            exists = bool(cursor.fetchone())
-            if not exists:
-                cursor.execute(f"CREATE INDEX {index_name} ON {table_name} USING GIST ({bbox_geom_col});")
+            conn.autocommit = False
         except Exception:
             pass
-    print(f"  Geometry index ensured: {index_name}")
+        return_db_connection(conn)
+
+def create_geometry_indexes(tables: List[str] = None) -> bool:
+    """Build GiST indexes on the geometry columns after the bulk loads, INDEX_BUILD_WORKERS tables at a time"""
+    tables = tables or GEOMETRY_TABLES
+    with ThreadPoolExecutor(max_workers=min(INDEX_BUILD_WORKERS, len(tables))) as executor:
+        results = list(executor.map(_create_table_geometry_indexes, tables))
+    return all(results)
 
 
 def create_proximity_join():
@@ -1320,30 +1948,30 @@ def create_proximity_join():
     try:
         cursor = conn.cursor()
         
+        # Geometries are filled by every save (and at table creation for older rows), so only
+        # make sure of the GiST indexes and fresh planner statistics here
+        for table_name in ['nger_unified', 'cer_approved_power_stations']:
+            ensure_gist_index(cursor, table_name, 'geom')
+            cursor.execute(f"ANALYZE {table_name}")
+        
         # Drop table if exists
         cursor.execute("DROP TABLE IF EXISTS nger_cer_proximity_matches")
         
-        # Create proximity matches table
+        # Create proximity matches table; ST_DWithin on the stored geom columns
+        # lets the planner use the GiST indexes instead of a filtered cross join
         create_sql = """
         CREATE TABLE nger_cer_proximity_matches AS
         SELECT 
             n.id as nger_id,
             c.id as cer_id,
             'proximity_1km' as match_type,
-            ST_Distance(
-                ST_SetSRID(ST_MakePoint(n.lon, n.lat), 4326),
-                ST_SetSRID(ST_MakePoint(c.lon, c.lat), 4326)
-            ) * 111000 as distance_meters
+            ST_Distance(n.geom, c.geom) * 111000 as distance_meters
         FROM nger_unified n
-        CROSS JOIN cer_approved_power_stations c
-        WHERE n.lat IS NOT NULL AND n.lon IS NOT NULL 
-        AND c.lat IS NOT NULL AND c.lon IS NOT NULL
-        AND n.state = c.state
-        AND ST_DWithin(
-            ST_SetSRID(ST_MakePoint(n.lon, n.lat), 4326),
-            ST_SetSRID(ST_MakePoint(c.lon, c.lat), 4326),
-            0.01
-        );
+        JOIN cer_approved_power_stations c
+          ON n.state = c.state
+         AND ST_DWithin(n.geom, c.geom, 0.01)
+        WHERE n.geom IS NOT NULL
+          AND c.geom IS NOT NULL;
         """
         
         cursor.execute(create_sql)
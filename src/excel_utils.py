@@ -4,6 +4,7 @@
 # Third-party library imports
 import openpyxl
 import pandas as pd
+from pandas.io.parsers import TextParser
 
 
 def _load_workbook_and_get_merged_ranges(file_path: str, sheet_name: str):
@@ -14,10 +15,8 @@ def _load_workbook_and_get_merged_ranges(file_path: str, sheet_name: str):
     return wb, ws, merged_ranges
 
 
-def get_merged_cells(file_path: str, sheet_name: str):
-    """Get merged cells information"""
-    _, ws, merged_ranges = _load_workbook_and_get_merged_ranges(file_path, sheet_name)
-    
+def _extract_merged_cells(ws, merged_ranges):
+    """Collect the row-6 merged cells (one ABS table per merged range)"""
     cells = []
     for merged_range in merged_ranges:
         if merged_range.min_row == 6:  # Only process merged cells in row 6
@@ -28,14 +27,11 @@ def get_merged_cells(file_path: str, sheet_name: str):
                     'start_col': merged_range.min_col,
                     'end_col': merged_range.max_col + 1
                 })
-    
     return cells
 
 
-def read_merged_headers(file_path: str, sheet_name: str) -> pd.DataFrame:
-    """Read Excel file with merged headers"""
-    _, ws, merged_ranges = _load_workbook_and_get_merged_ranges(file_path, sheet_name)
-    
+def _extract_header_names(ws, merged_ranges):
+    """Build column names from the row-7 headers, resolving merged cells"""
     column_names = []
     for col in range(1, ws.max_column + 1):
         parts = []
@@ -54,7 +50,28 @@ def read_merged_headers(file_path: str, sheet_name: str) -> pd.DataFrame:
                     parts.append(part)
         
         column_names.append(" - ".join(parts) if parts else f"Column_{col}")
-    
-    df = pd.read_excel(file_path, sheet_name=sheet_name, header=None, skiprows=7)
+    return column_names
+
+
+def _sheet_data_frame(ws, column_names, first_row: int = 8) -> pd.DataFrame:
+    """Build the data frame from the already-loaded worksheet (same shape as read_excel with skiprows=7)"""
+    rows = [
+        tuple(int(v) if isinstance(v, float) and v.is_integer() else v for v in row)
+        for row in ws.iter_rows(min_row=first_row, values_only=True)
+    ]
+    # Drop trailing blank rows, as read_excel does
+    while rows and all(v is None or v == '' for v in rows[-1]):
+        rows.pop()
+    # Same parser read_excel runs its rows through, so dtypes match
+    df = TextParser(rows, header=None).read() if rows else pd.DataFrame()
     df.columns = column_names[:len(df.columns)]
-    return df
\ No newline at end of file
+    return df
+
+
+def read_sheet_with_merges(file_path: str, sheet_name: str):
+    """Read merged cells and merged-header data frame with a single workbook load"""
+    _, ws, merged_ranges = _load_workbook_and_get_merged_ranges(file_path, sheet_name)
+    merged_cells = _extract_merged_cells(ws, merged_ranges)
+    df = _sheet_data_frame(ws, _extract_header_names(ws, merged_ranges))
+    return merged_cells, df
+
@@ -5,6 +5,8 @@
 import hashlib
 import json
 import os
+import re
+import tempfile
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -13,6 +15,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 # Third-party library imports
+import numpy as np
 import pandas as pd
 import requests
 
@@ -88,6 +91,8 @@ class GeocodingCache:
         self.cache_file = Path(cache_file)
         self.cache = {}
         self.lock = threading.RLock()  # Reentrant lock, supports multithreading
+        self.save_lock = threading.Lock()  # Serializes file writes
+        self.unsaved_count = 0  # Entries added since the last save (see start_cache_autosave)
         self.load_cache()
     
     def _get_cache_key(self, query: str) -> str:
@@ -108,37 +113,60 @@ class GeocodingCache:
             print(f"Failed to load geocoding cache: {e}")
             self.cache = {}
     
-    def save_cache(self):
-        """Save cache to file"""
+    def save_cache(self, verbose: bool = True):
+        """Save cache to file atomically (write temp file, then replace)"""
         try:
-            with self.lock:
-                # Save new cache directly (no backup file creation)
-                with open(self.cache_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.cache, f, ensure_ascii=False, indent=2)
+            with self.save_lock:
+                # Snapshot under the cache lock so lookups are not blocked by disk I/O
+                with self.lock:
+                    snapshot = dict(self.cache)
+                    self.unsaved_count = 0
                 
-                print(f"Geocoding cache saved: {len(self.cache)} records")
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.cache_file.parent,
+                                                 suffix='.tmp', delete=False) as f:
+                    tmp_path = f.name
+                    try:
+                        json.dump(snapshot, f, ensure_ascii=False, indent=2)
+                    except Exception:
+                        f.close()
+                        os.unlink(tmp_path)
+                        raise
+                os.replace(tmp_path, self.cache_file)
+                
+                if verbose:
+                    print(f"Geocoding cache saved: {len(snapshot)} records")
         except Exception as e:
             print(f"Failed to save geocoding cache: {e}")
     
-    def get(self, query: str) -> Optional[Dict]:
-        """Get cached result"""
+    def has_unsaved_changes(self) -> bool:
+        """Check if entries were added since the last save"""
         with self.lock:
-            cache_key = self._get_cache_key(query)
-            cached_entry = self.cache.get(cache_key)
-            if cached_entry:
-                return cached_entry.get('result')
-            return None
+            return self.unsaved_count > 0
+    
+    def get(self, query: str) -> Optional[Dict]:
+        """Get cached result (lock-free: entries are only ever replaced whole, and a
+        single dict.get is atomic under the GIL)"""
+        cached_entry = self.cache.get(self._get_cache_key(query))
+        if cached_entry:
+            return cached_entry.get('result')
+        return None
     
     def _set_cache_entry(self, query: str, result: Optional[Dict]) -> None:
         """Common method to set cache entry"""
+        # Hash and build the entry before taking the lock; only the publish is serialized
+        cache_key = self._get_cache_key(query)
+        entry = {
+            'query': query,
+            'result': result,
+            'cached_at': time.time(),
+            'cache_key': cache_key
+        }
+        # Saving is left to the background autosave and the per-table saves, so the
+        # geocoding workers never write the cache file themselves
         with self.lock:
-            cache_key = self._get_cache_key(query)
-            self.cache[cache_key] = {
-                'query': query,
-                'result': result,
-                'cached_at': time.time(),
-                'cache_key': cache_key
-            }
+            self.cache[cache_key] = entry
+            self.unsaved_count += 1
     
     def set(self, query: str, result: Dict) -> None:
         """Set cache result"""
@@ -174,6 +202,23 @@ def save_global_cache():
     if _global_cache:
         _global_cache.save_cache()
 
+def flush_global_cache():
+    """Save global cache only if it has unsaved entries (safe to call repeatedly, e.g. at exit)"""
+    if _global_cache and _global_cache.has_unsaved_changes():
+        _global_cache.save_cache()
+
+def start_cache_autosave(interval: float = 60.0) -> threading.Event:
+    """Periodically snapshot the global cache in a background thread; set the returned event to stop"""
+    stop_event = threading.Event()
+    
+    def _autosave():
+        while not stop_event.wait(interval):
+            if _global_cache and _global_cache.has_unsaved_changes():
+                _global_cache.save_cache(verbose=False)
+    
+    threading.Thread(target=_autosave, daemon=True).start()
+    return stop_event
+
 
 def initialize_geocoding_cache(cache_file: str = None):
     """Initialize geocoding cache (called at program startup)"""
@@ -222,6 +267,19 @@ GEOCODE_COLUMNS = [
     'bbox_south', 'bbox_north', 'bbox_west', 'bbox_east'
 ]
 
+# Row fields read by geocode_single_station/geocode_single_nger and the Geocoder query builders
+GEOCODE_INPUT_FIELDS = frozenset({
+    'power_station_name', 'Power station name', 'project_name', 'Project Name',
+    'state', 'State', 'State ', 'postcode', 'Postcode', 'fuel_source', 'Fuel Source',
+    'facilityname', 'reportingentity', 'controllingcorporation'
+})
+
+def geocode_task_rows(df: pd.DataFrame) -> list:
+    """Plain dict rows (only .get is needed, much cheaper than per-row Series) holding just
+    the GEOCODE_INPUT_FIELDS columns rather than every column of the frame"""
+    columns = [col for col in df.columns if col in GEOCODE_INPUT_FIELDS]
+    return df[columns].to_dict('records')
+
 def initialize_geocode_columns(df: pd.DataFrame) -> None:
     """Initialize geocoding columns"""
     for col in GEOCODE_COLUMNS:
@@ -229,20 +287,17 @@ def initialize_geocode_columns(df: pd.DataFrame) -> None:
 
 def update_dataframe_with_results(df: pd.DataFrame, results: list) -> int:
     """Update DataFrame with geocoding results"""
-    success_count = 0
+    hits = [(result['idx'], result['result']) for result in results if result['success'] and result['result']]
+    if not hits:
+        return 0
     
-    for result in results:
-        if result['success'] and result['result']:
-            idx = result['idx']
-            geocode_result = result['result']
-            
-            # Update geocoding results
-            for col in GEOCODE_COLUMNS:
-                df.at[idx, col] = geocode_result.get(col)
-            
-            success_count += 1
+    # One block assignment instead of a df.at write per row and column
+    indices = [idx for idx, _ in hits]
+    values = np.empty((len(hits), len(GEOCODE_COLUMNS)), dtype=object)
+    values[:] = [[geocode_result.get(col) for col in GEOCODE_COLUMNS] for _, geocode_result in hits]
+    df.loc[indices, GEOCODE_COLUMNS] = values
     
-    return success_count
+    return len(hits)
 
 def add_geocoding_to_cer_data(df: pd.DataFrame, table_type: str, max_workers: int = 3) -> pd.DataFrame:
     """Add geocoding to CER data (multithreaded version)"""
@@ -255,7 +310,7 @@ def add_geocoding_to_cer_data(df: pd.DataFrame, table_type: str, max_workers: in
     print(f"Preparing to process {total_rows} power stations...")
     
     # Prepare multithreaded tasks
-    tasks = [(idx, row, table_type) for idx, row in df.iterrows()]
+    tasks = [(idx, row, table_type) for idx, row in zip(df.index, geocode_task_rows(df))]
     
     # Multithreaded processing
     results = []
@@ -347,7 +402,7 @@ def add_geocoding_to_nger_data(df: pd.DataFrame, max_workers: int = 5) -> pd.Dat
     print(f"Starting geocoding processing for NGER facilities ({max_workers} threads)...")
     initialize_geocode_columns(df)
 
-    tasks = [(idx, row) for idx, row in df.iterrows()]
+    tasks = [(idx, row) for idx, row in zip(df.index, geocode_task_rows(df))]
     results = []
     total_rows = len(tasks)
     try:
@@ -374,6 +429,18 @@ def add_geocoding_to_nger_data(df: pd.DataFrame, max_workers: int = 5) -> pd.Dat
 # Geocoder
 # ============================================================================
 
+# Placeholder values treated as blank when building queries
+_BLANK_TOKENS = frozenset({'n/a', 'na', 'nan', 'none', '-'})
+# Queries containing any of these substrings are discarded
+_INVALID_QUERY_PATTERN = re.compile('n/a|na|nan|none')
+
+def _clean_query_part(value: Any) -> str:
+    """Stripped string for a query component, '' for blanks/placeholders"""
+    if value is None:
+        return ''
+    v = str(value).strip()
+    return '' if v.lower() in _BLANK_TOKENS else v
+
 class Geocoder:
     """Geocoder - Google Maps API version"""
     
@@ -505,15 +572,10 @@ class Geocoder:
             print(f"  [Google API failed] Query: {query} -> Error: {e}")
             return None
     
-    def build_geocode_queries(self, row: pd.Series, table_type: str) -> list:
+    def build_geocode_queries(self, row: Dict[str, Any], table_type: str) -> list:
         """Build geocoding query list"""
         queries = []
-
-        def norm(s: Any) -> str:
-            v = str(s).strip() if s is not None else ''
-            if v == '' or v.lower() in {'n/a', 'na', 'nan', 'none', '-'}:
-                return ''
-            return v
+        norm = _clean_query_part
         
         if table_type == "approved_power_stations":
             # Support normalized column names
@@ -565,19 +627,17 @@ class Geocoder:
                 queries = [q for q in queries if q is not None]
         
         # Filter queries containing invalid tokens
-        invalid_tokens = {'n/a', 'na', 'nan', 'none'}
         filtered = []
         seen = set()
         for q in queries:
-            ql = q.lower()
-            if any(tok in ql for tok in invalid_tokens):
+            if _INVALID_QUERY_PATTERN.search(q.lower()):
                 continue
             if q not in seen:
                 filtered.append(q)
                 seen.add(q)
         return filtered
     
-    def geocode_power_station(self, row: pd.Series, table_type: str) -> Dict:
+    def geocode_power_station(self, row: Dict[str, Any], table_type: str) -> Dict:
         """Geocode power station"""
         geocode_result = {'lat': None, 'lon': None, 'formatted_address': None, 'place_id': None, 'postcode': None,
                          'bbox_south': None, 'bbox_north': None, 'bbox_west': None, 'bbox_east': None}
@@ -598,15 +658,10 @@ class Geocoder:
             print(f"  Geocoding failed: tried {len(queries)} queries with no results")
         return geocode_result
     
-    def build_nger_queries(self, row: pd.Series) -> list:
+    def build_nger_queries(self, row: Dict[str, Any]) -> list:
         """Build geocoding query candidates based on NGER row."""
         queries = []
-
-        def norm(s: Any) -> str:
-            v = str(s).strip() if s is not None else ''
-            if v == '' or v.lower() in {'n/a', 'na', 'nan', 'none', '-'}:
-                return ''
-            return v
+        norm = _clean_query_part
 
         facility = norm(row.get('facilityname', ''))
         state = norm(row.get('state', ''))
@@ -631,21 +686,19 @@ class Geocoder:
             queries.append(f"{state}, Australia")
 
         # Deduplicate and filter invalid tokens
-        invalid_tokens = {'n/a', 'na', 'nan', 'none'}
         deduped = []
         seen = set()
         for q in queries:
             if not q:
                 continue
-            ql = q.lower()
-            if any(tok in ql for tok in invalid_tokens):
+            if _INVALID_QUERY_PATTERN.search(q.lower()):
                 continue
             if q not in seen:
                 deduped.append(q)
                 seen.add(q)
         return deduped
     
-    def geocode_nger(self, row: pd.Series) -> Dict:
+    def geocode_nger(self, row: Dict[str, Any]) -> Dict:
         """Geocode NGER facility"""
         geocode_result = {'lat': None, 'lon': None, 'formatted_address': None, 'place_id': None, 'postcode': None,
                          'bbox_south': None, 'bbox_north': None, 'bbox_west': None, 'bbox_east': None}
@@ -2,8 +2,13 @@
 """State name standardization tool"""
 
 # Standard library imports
+from functools import lru_cache
 from typing import Dict, Optional, Union
 
+# Third-party library imports
+import numpy as np
+import pandas as pd
+
 # Australian state name standardization mapping table
 STATE_MAPPING = {
     # Full names mapped to abbreviations
@@ -91,7 +96,15 @@ def standardize_state_name(state_input: Union[str, int, None]) -> Optional[str]:
         return None
     
     # Convert to string and clean
-    state_str = str(state_input).strip()
+    return _standardize_state_str(str(state_input).strip())
+
+@lru_cache(maxsize=1024)
+def _standardize_state_str(state_str: str) -> Optional[str]:
+    """Standardize a stripped state string (memoized: only a few hundred distinct inputs occur)"""
+    # Standard abbreviations map to themselves (the partial matching below would
+    # otherwise turn 'WA' into 'NSW' via "wales" and find no match for 'OT')
+    if state_str in STATE_FULL_NAMES:
+        return state_str
     
     # Handle empty strings
     if not state_str or state_str.lower() in {'', 'nan', 'none', 'null'}:
@@ -120,6 +133,19 @@ def get_state_full_name(state_abbrev: str) -> Optional[str]:
     """
     return STATE_FULL_NAMES.get(state_abbrev)
 
+def standardize_state_series(column: pd.Series) -> pd.Series:
+    """
+    Standardize a column of state names, calling standardize_state_name once per distinct value
+    Args:
+        column: pandas Series of state names
+    Returns:
+        Series of standardized abbreviations (missing where unrecognizable)
+    """
+    codes, uniques = pd.factorize(column)
+    # Trailing None is picked up by the -1 code of missing values
+    lookup = np.array([standardize_state_name(value) for value in uniques] + [None], dtype=object)
+    return pd.Series(lookup[codes], index=column.index, name=column.name).infer_objects()
+
 def standardize_dataframe_states(df, state_column: str = 'state') -> None:
     """
     Standardize the state column in a DataFrame
@@ -128,7 +154,7 @@ def standardize_dataframe_states(df, state_column: str = 'state') -> None:
         state_column: State column name
     """
     if state_column in df.columns:
-        df[state_column] = df[state_column].apply(standardize_state_name)
+        df[state_column] = standardize_state_series(df[state_column])
 
 def get_state_statistics(df, state_column: str = 'state') -> Dict:
     """
@@ -143,7 +169,7 @@ def get_state_statistics(df, state_column: str = 'state') -> Dict:
         return {'error': f'Column {state_column} not found'}
     
     # Standardize state names
-    standardized = df[state_column].apply(standardize_state_name)
+    standardized = standardize_state_series(df[state_column])
     
     # Statistics
     stats = {
@@ -172,7 +198,7 @@ def validate_state_data(df, state_column: str = 'state') -> Dict:
     original_states = df[state_column].dropna().unique()
     
     # Standardize state names
-    standardized = df[state_column].apply(standardize_state_name)
+    standardized = standardize_state_series(df[state_column])
     valid_states = standardized.dropna().unique()
     
     # Find unstandardizable state names (avoid duplicate standardize_state_name calls)
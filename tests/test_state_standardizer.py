@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""Tests for state name standardization"""
+
+# Standard library imports
+import sys
+import unittest
+from pathlib import Path
+
+# Third-party library imports
+import pandas as pd
+
+# Modules in src import each other as top-level modules
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from state_standardizer import standardize_dataframe_states, standardize_state_name
+
+
+class StandardAbbreviationTest(unittest.TestCase):
+    def test_wa_maps_to_itself(self):
+        # Substring matching used to turn 'WA' into 'NSW' ("wales")
+        self.assertEqual(standardize_state_name('WA'), 'WA')
+
+    def test_ot_maps_to_itself(self):
+        # 'OT' is only a mapping value ('9' -> 'OT'), so it used to come back as None
+        self.assertEqual(standardize_state_name('OT'), 'OT')
+
+    def test_restandardizing_is_idempotent(self):
+        df = pd.DataFrame({'state': ['Western Australia', '9', 'nsw', None]})
+        standardize_dataframe_states(df)
+        self.assertEqual(df['state'].iloc[:3].tolist(), ['WA', 'OT', 'NSW'])
+        self.assertTrue(pd.isna(df['state'].iloc[3]))
+        first = df['state'].copy()
+        standardize_dataframe_states(df)
+        pd.testing.assert_series_equal(df['state'], first)
+
+
+if __name__ == '__main__':
+    unittest.main()